@@ -17,12 +17,15 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create user table."""
     op.create_table(
         'user',
-        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
         sa.Column('email', sa.String(length=255), nullable=False),
         sa.Column('password_hash', sa.String(length=255), nullable=False),
         sa.Column('full_name', sa.String(length=100), nullable=True),
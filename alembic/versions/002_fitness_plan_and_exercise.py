@@ -17,14 +17,17 @@ down_revision: Union[str, None] = '001'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create fitness_plan and exercise tables."""
     # Create fitness_plan table
     op.create_table(
         'fitness_plan',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('user_id', ID_TYPE, nullable=False),
         sa.Column('name', sa.String(length=50), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
         sa.Column('status', sa.String(length=20), nullable=False),
@@ -34,13 +37,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_fitness_plan_user_id', 'fitness_plan', ['user_id'])
 
     # Create exercise table
     op.create_table(
         'exercise',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('plan_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('plan_id', ID_TYPE, nullable=False),
         sa.Column('name', sa.String(length=100), nullable=False),
         sa.Column('duration_minutes', sa.Integer(), nullable=True),
         sa.Column('repetitions', sa.Integer(), nullable=True),
@@ -52,13 +54,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['plan_id'], ['fitness_plan.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_exercise_plan_id', 'exercise', ['plan_id'])
 
     # Create reminder table (placeholder for Phase 4)
     op.create_table(
         'reminder',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('plan_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('plan_id', ID_TYPE, nullable=False),
         sa.Column('reminder_time', sa.Time(), nullable=False),
         sa.Column('frequency', sa.String(length=20), nullable=False),
         sa.Column('days_of_week', sa.Text(), nullable=True),
@@ -68,7 +69,13 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['plan_id'], ['fitness_plan.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_reminder_plan_id', 'reminder', ['plan_id'])
+
+    # Build all indexes in one pass once every table exists, outside the
+    # migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index('ix_fitness_plan_user_id', 'fitness_plan', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_exercise_plan_id', 'exercise', ['plan_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_reminder_plan_id', 'reminder', ['plan_id'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 # revision identifiers, used by Alembic.
 revision: str = '003'
@@ -16,13 +17,16 @@ down_revision: Union[str, None] = '002'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create workout_log table."""
     op.create_table(
         'workout_log',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('user_id', ID_TYPE, nullable=False),
         sa.Column('workout_date', sa.Date(), nullable=False),
         sa.Column('workout_name', sa.String(length=100), nullable=False),
         sa.Column('duration_minutes', sa.Integer(), nullable=False),
@@ -33,8 +37,10 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_workout_log_user_id', 'workout_log', ['user_id'])
-    op.create_index('ix_workout_log_workout_date', 'workout_log', ['workout_date'])
+    # Build indexes outside the migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index('ix_workout_log_user_id', 'workout_log', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_workout_log_workout_date', 'workout_log', ['workout_date'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
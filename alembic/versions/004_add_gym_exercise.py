@@ -8,6 +8,7 @@ Create Date: 2025-11-11
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -16,14 +17,17 @@ down_revision: Union[str, None] = '003'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create gym_exercise_log and gym_exercise_set tables."""
     # Create gym_exercise_log table
     op.create_table(
         'gym_exercise_log',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('user_id', ID_TYPE, nullable=False),
         sa.Column('workout_date', sa.Date(), nullable=False),
         sa.Column('exercise_name', sa.String(length=100), nullable=False),
         sa.Column('notes', sa.Text(), nullable=True),
@@ -32,14 +36,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_gym_exercise_log_user_id', 'gym_exercise_log', ['user_id'])
-    op.create_index('ix_gym_exercise_log_workout_date', 'gym_exercise_log', ['workout_date'])
 
     # Create gym_exercise_set table
     op.create_table(
         'gym_exercise_set',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('gym_exercise_log_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('gym_exercise_log_id', ID_TYPE, nullable=False),
         sa.Column('set_number', sa.Integer(), nullable=False),
         sa.Column('reps', sa.Integer(), nullable=False),
         sa.Column('weight', sa.Float(), nullable=True),
@@ -48,7 +50,13 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['gym_exercise_log_id'], ['gym_exercise_log.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_gym_exercise_set_gym_exercise_log_id', 'gym_exercise_set', ['gym_exercise_log_id'])
+
+    # Build all indexes in one pass once every table exists, outside the
+    # migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index('ix_gym_exercise_log_user_id', 'gym_exercise_log', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_gym_exercise_log_workout_date', 'gym_exercise_log', ['workout_date'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_gym_exercise_set_gym_exercise_log_id', 'gym_exercise_set', ['gym_exercise_log_id'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
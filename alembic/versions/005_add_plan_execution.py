@@ -8,6 +8,7 @@ Create Date: 2025-11-11
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -16,15 +17,18 @@ down_revision: Union[str, None] = '004'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create plan_execution and exercise_execution tables."""
     # Create plan_execution table
     op.create_table(
         'plan_execution',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('plan_id', sa.String(length=36), nullable=False),
-        sa.Column('user_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('plan_id', ID_TYPE, nullable=False),
+        sa.Column('user_id', ID_TYPE, nullable=False),
         sa.Column('execution_date', sa.Date(), nullable=False),
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
@@ -33,16 +37,13 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_plan_execution_plan_id', 'plan_execution', ['plan_id'])
-    op.create_index('ix_plan_execution_user_id', 'plan_execution', ['user_id'])
-    op.create_index('ix_plan_execution_execution_date', 'plan_execution', ['execution_date'])
 
     # Create exercise_execution table
     op.create_table(
         'exercise_execution',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('plan_execution_id', sa.String(length=36), nullable=False),
-        sa.Column('exercise_id', sa.String(length=36), nullable=False),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('plan_execution_id', ID_TYPE, nullable=False),
+        sa.Column('exercise_id', ID_TYPE, nullable=False),
         sa.Column('completed', sa.Boolean(), nullable=False),
         sa.Column('actual_duration_minutes', sa.Integer(), nullable=True),
         sa.Column('actual_repetitions', sa.Integer(), nullable=True),
@@ -52,8 +53,15 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['exercise_id'], ['exercise.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index('ix_exercise_execution_plan_execution_id', 'exercise_execution', ['plan_execution_id'])
-    op.create_index('ix_exercise_execution_exercise_id', 'exercise_execution', ['exercise_id'])
+
+    # Build all indexes in one pass once every table exists, outside the
+    # migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index('ix_plan_execution_plan_id', 'plan_execution', ['plan_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_plan_execution_user_id', 'plan_execution', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_plan_execution_execution_date', 'plan_execution', ['execution_date'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_exercise_execution_plan_execution_id', 'exercise_execution', ['plan_execution_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_exercise_execution_exercise_id', 'exercise_execution', ['exercise_id'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
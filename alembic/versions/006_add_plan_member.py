@@ -8,6 +8,7 @@ Create Date: 2025-11-11
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -16,15 +17,18 @@ down_revision: Union[str, None] = '005'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Native 16-byte uuid on PostgreSQL, CHAR(36)-style text elsewhere
+ID_TYPE = sa.String(length=36).with_variant(postgresql.UUID(as_uuid=True), 'postgresql')
+
 
 def upgrade() -> None:
     """Create plan_member table."""
     op.create_table(
         'plan_member',
-        sa.Column('id', sa.String(length=36), nullable=False),
-        sa.Column('plan_id', sa.String(length=36), nullable=False),
-        sa.Column('user_id', sa.String(length=36), nullable=False),
-        sa.Column('invited_by', sa.String(length=36), nullable=True),
+        sa.Column('id', ID_TYPE, nullable=False),
+        sa.Column('plan_id', ID_TYPE, nullable=False),
+        sa.Column('user_id', ID_TYPE, nullable=False),
+        sa.Column('invited_by', ID_TYPE, nullable=True),
         sa.Column('joined_at', sa.TIMESTAMP(), nullable=False),
         sa.ForeignKeyConstraint(['plan_id'], ['fitness_plan.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
@@ -32,8 +36,10 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('plan_id', 'user_id', name='uq_plan_member')
     )
-    op.create_index('ix_plan_member_plan_id', 'plan_member', ['plan_id'])
-    op.create_index('ix_plan_member_user_id', 'plan_member', ['user_id'])
+    # Build indexes outside the migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        op.create_index('ix_plan_member_plan_id', 'plan_member', ['plan_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_plan_member_user_id', 'plan_member', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
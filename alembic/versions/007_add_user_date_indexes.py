@@ -0,0 +1,47 @@
+"""Add composite (user_id, date DESC) indexes for list queries
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (composite index, table, date column, replaced single-column indexes)
+USER_DATE_INDEXES = [
+    ('ix_workout_log_user_date', 'workout_log', 'workout_date',
+     ['ix_workout_log_user_id', 'ix_workout_log_workout_date']),
+    ('ix_gym_exercise_log_user_date', 'gym_exercise_log', 'workout_date',
+     ['ix_gym_exercise_log_user_id', 'ix_gym_exercise_log_workout_date']),
+    ('ix_plan_execution_user_date', 'plan_execution', 'execution_date',
+     ['ix_plan_execution_user_id', 'ix_plan_execution_execution_date']),
+]
+
+
+def upgrade() -> None:
+    """Replace separate user_id/date indexes with one composite index per table."""
+    # Build indexes outside the migration transaction so writers are not blocked
+    with op.get_context().autocommit_block():
+        for index_name, table_name, date_column, old_indexes in USER_DATE_INDEXES:
+            op.create_index(index_name, table_name, ['user_id', sa.text(f'{date_column} DESC')], postgresql_concurrently=True, if_not_exists=True)
+            for old_index in old_indexes:
+                op.drop_index(old_index, table_name=table_name, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id/date indexes."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, date_column, old_indexes in USER_DATE_INDEXES:
+            op.create_index(old_indexes[0], table_name, ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+            op.create_index(old_indexes[1], table_name, [date_column], postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,125 @@
+"""Convert String(36) id columns to native uuid on PostgreSQL
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> id columns stored as String(36) by migrations 001-006
+ID_COLUMNS = {
+    'user': ['id'],
+    'fitness_plan': ['id', 'user_id'],
+    'exercise': ['id', 'plan_id'],
+    'reminder': ['id', 'plan_id'],
+    'workout_log': ['id', 'user_id'],
+    'gym_exercise_log': ['id', 'user_id'],
+    'gym_exercise_set': ['id', 'gym_exercise_log_id'],
+    'plan_execution': ['id', 'plan_id', 'user_id'],
+    'exercise_execution': ['id', 'plan_execution_id', 'exercise_id'],
+    'plan_member': ['id', 'plan_id', 'user_id', 'invited_by'],
+}
+
+# (table, column, referenced table, ondelete) for every FK between id columns
+FOREIGN_KEYS = [
+    ('fitness_plan', 'user_id', 'user', 'CASCADE'),
+    ('exercise', 'plan_id', 'fitness_plan', 'CASCADE'),
+    ('reminder', 'plan_id', 'fitness_plan', 'CASCADE'),
+    ('workout_log', 'user_id', 'user', 'CASCADE'),
+    ('gym_exercise_log', 'user_id', 'user', 'CASCADE'),
+    ('gym_exercise_set', 'gym_exercise_log_id', 'gym_exercise_log', 'CASCADE'),
+    ('plan_execution', 'plan_id', 'fitness_plan', None),
+    ('plan_execution', 'user_id', 'user', None),
+    ('exercise_execution', 'plan_execution_id', 'plan_execution', 'CASCADE'),
+    ('exercise_execution', 'exercise_id', 'exercise', None),
+    ('plan_member', 'plan_id', 'fitness_plan', 'CASCADE'),
+    ('plan_member', 'user_id', 'user', 'CASCADE'),
+    ('plan_member', 'invited_by', 'user', None),
+]
+
+
+# Non-unique secondary indexes on the converted tables as of revision 007.
+# They are dropped before the table rewrite and rebuilt concurrently after it,
+# so the rewrite does not maintain them row by row under its exclusive lock.
+SECONDARY_INDEXES = [
+    ('ix_fitness_plan_user_id', 'fitness_plan', ['user_id']),
+    ('ix_exercise_plan_id', 'exercise', ['plan_id']),
+    ('ix_reminder_plan_id', 'reminder', ['plan_id']),
+    ('ix_workout_log_user_date', 'workout_log', ['user_id', sa.text('workout_date DESC')]),
+    ('ix_gym_exercise_log_user_date', 'gym_exercise_log', ['user_id', sa.text('workout_date DESC')]),
+    ('ix_gym_exercise_set_gym_exercise_log_id', 'gym_exercise_set', ['gym_exercise_log_id']),
+    ('ix_plan_execution_plan_id', 'plan_execution', ['plan_id']),
+    ('ix_plan_execution_user_date', 'plan_execution', ['user_id', sa.text('execution_date DESC')]),
+    ('ix_exercise_execution_plan_execution_id', 'exercise_execution', ['plan_execution_id']),
+    ('ix_exercise_execution_exercise_id', 'exercise_execution', ['exercise_id']),
+    ('ix_plan_member_plan_id', 'plan_member', ['plan_id']),
+    ('ix_plan_member_user_id', 'plan_member', ['user_id']),
+]
+
+
+def _needs_conversion(target_type: str) -> bool:
+    """Return True when the PostgreSQL id columns are not yet of the target type.
+
+    Databases created after migrations 001-006 switched to native uuid are
+    already converted. Offline (--sql) runs cannot inspect, so always emit.
+    """
+    if op.get_context().as_sql:
+        return True
+    row = op.get_bind().execute(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'user' AND column_name = 'id'"
+    )).first()
+    return row is not None and row[0] != target_type
+
+
+def _convert(type_sql: str, using: str) -> None:
+    """Drop id foreign keys, retype every id column, then restore the keys."""
+    for index_name, table_name, _ in SECONDARY_INDEXES:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
+
+    for table_name, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(f'{table_name}_{column}_fkey', table_name, type_='foreignkey')
+
+    for table_name, columns in ID_COLUMNS.items():
+        alters = ', '.join(
+            f'ALTER COLUMN {column} TYPE {type_sql} USING {column}::{using}'
+            for column in columns
+        )
+        op.execute(f'ALTER TABLE "{table_name}" {alters}')
+
+    for table_name, column, referent, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(
+            f'{table_name}_{column}_fkey', table_name, referent,
+            [column], ['id'], ondelete=ondelete,
+        )
+
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns in SECONDARY_INDEXES:
+            op.create_index(index_name, table_name, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def upgrade() -> None:
+    """Store ids as 16-byte uuid instead of 36-character text on PostgreSQL."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    if _needs_conversion('uuid'):
+        _convert('uuid', 'uuid')
+
+
+def downgrade() -> None:
+    """Restore the varchar(36) id columns on PostgreSQL."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    if _needs_conversion('character varying'):
+        _convert('VARCHAR(36)', 'text')
@@ -0,0 +1,32 @@
+"""Replace fitness_plan user_id index with a partial index on live plans
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only plans that have not been soft-deleted."""
+    active = sa.text('deleted_at IS NULL')
+    with op.get_context().autocommit_block():
+        op.create_index('ix_fitness_plan_user_id_active', 'fitness_plan', ['user_id'], postgresql_where=active, sqlite_where=active, postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_fitness_plan_user_id', table_name='fitness_plan', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the full fitness_plan user_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_fitness_plan_user_id', 'fitness_plan', ['user_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_fitness_plan_user_id_active', table_name='fitness_plan', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,29 @@
+"""Add (user_id, exercise_name, workout_date) index for exercise trends
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index gym exercise logs by user, exercise name and date."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_gym_exercise_log_user_name_date', 'gym_exercise_log', ['user_id', 'exercise_name', 'workout_date'], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the exercise trend index."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_gym_exercise_log_user_name_date', table_name='gym_exercise_log', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,43 @@
+"""Add BRIN indexes on log dates for range scans (PostgreSQL only)
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, date column); the btree composites stay for per-user lookups
+BRIN_INDEXES = [
+    ('ix_workout_log_date_brin', 'workout_log', 'workout_date'),
+    ('ix_gym_exercise_log_date_brin', 'gym_exercise_log', 'workout_date'),
+    ('ix_plan_execution_date_brin', 'plan_execution', 'execution_date'),
+]
+
+
+def upgrade() -> None:
+    """Create BRIN indexes for date-range scans across all users."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for index_name, table_name, date_column in BRIN_INDEXES:
+            op.create_index(index_name, table_name, [date_column], postgresql_using='brin', postgresql_with={'pages_per_range': 32}, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the BRIN indexes."""
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in BRIN_INDEXES:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,31 @@
+"""Replace plan_execution.plan_id index with (plan_id, execution_date DESC)
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index plan executions by plan and date, dropping the plan_id-only index it covers."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_plan_execution_plan_date', 'plan_execution', ['plan_id', sa.text('execution_date DESC')], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_plan_execution_plan_id', table_name='plan_execution', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the plan_id-only index."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_plan_execution_plan_id', 'plan_execution', ['plan_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_plan_execution_plan_date', table_name='plan_execution', postgresql_concurrently=True, if_exists=True)
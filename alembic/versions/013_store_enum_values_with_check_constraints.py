@@ -0,0 +1,44 @@
+"""Store status, intensity and frequency as enum values with CHECK constraints
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, constraint, allowed values). The columns were written through
+# SQLAlchemy's non-native Enum type, which stores member names ('ACTIVE');
+# the plain String columns store the lowercase values ('active') instead.
+ENUM_COLUMNS = [
+    ('fitness_plan', 'status', 'check_status_valid', ('active', 'paused')),
+    ('exercise', 'intensity', 'check_intensity_valid', ('low', 'medium', 'high')),
+    ('reminder', 'frequency', 'check_frequency_valid', ('daily', 'weekly', 'custom')),
+]
+
+
+def upgrade() -> None:
+    """Rewrite member names as values and constrain each column to its values."""
+    for table_name, column, constraint, values in ENUM_COLUMNS:
+        allowed = ', '.join(f"'{value}'" for value in values)
+        op.execute(f'UPDATE "{table_name}" SET {column} = LOWER({column})')
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.create_check_constraint(constraint, sa.text(f'{column} IN ({allowed})'))
+
+
+def downgrade() -> None:
+    """Drop the CHECK constraints and restore member names."""
+    for table_name, column, constraint, _ in ENUM_COLUMNS:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.drop_constraint(constraint, type_='check')
+        op.execute(f'UPDATE "{table_name}" SET {column} = UPPER({column})')
@@ -1,27 +1,57 @@
 """Authentication middleware for JWT verification."""
-from typing import Dict, Optional
-from fastapi import Depends, HTTPException, status
+from typing import Any, Dict, Optional
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from src.core.security import verify_token
 
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+_BEARER_HEADERS: Dict[str, str] = {"WWW-Authenticate": "Bearer"}
+
+
+def _user_from_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build the current-user dict from a decoded token payload.
+
+    Args:
+        payload: Decoded JWT payload
+
+    Returns:
+        User information, or None if the payload has no valid user_id
+    """
+    try:
+        user_id = UUID(payload["user_id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return {"user_id": user_id, "email": payload.get("email")}
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> Dict[str, any]:
+) -> Dict[str, Any]:
     """Get current authenticated user from JWT token.
 
+    The decoded user is stored on ``request.state`` so other dependencies in
+    the same request reuse it instead of decoding the token again.
+
     Args:
+        request: Incoming request
         credentials: HTTP authorization credentials with bearer token
 
     Returns:
-        Dictionary containing user information from token payload
+        Dictionary containing user information from token payload, with
+        ``user_id`` already decoded to a UUID
 
     Raises:
         HTTPException: If token is invalid or expired
     """
+    cached = request.state.__dict__.get("current_user")
+    if cached is not None:
+        return cached
+
     token = credentials.credentials
     payload = verify_token(token)
 
@@ -29,35 +59,43 @@ async def get_current_user(
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_HEADERS,
         )
 
-    user_id = payload.get("user_id")
-    if user_id is None:
+    user = _user_from_payload(payload)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_HEADERS,
         )
 
-    return {"user_id": user_id, "email": payload.get("email")}
+    request.state.current_user = user
+    return user
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-) -> Optional[Dict[str, any]]:
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Optional[Dict[str, Any]]:
     """Get current user if authenticated, otherwise return None.
 
     Args:
+        request: Incoming request
         credentials: Optional HTTP authorization credentials
 
     Returns:
         User information if authenticated, None otherwise
     """
-    if credentials is None:
-        return None
+    cached = request.state.__dict__.get("current_user")
+    if cached is not None:
+        return cached
 
-    try:
-        return await get_current_user(credentials)
-    except HTTPException:
+    payload = verify_token(credentials.credentials) if credentials else None
+    if payload is None:
         return None
+
+    user = _user_from_payload(payload)
+    if user is not None:
+        request.state.current_user = user
+    return user
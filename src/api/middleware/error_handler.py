@@ -1,10 +1,16 @@
 """Unified error response handler."""
 from typing import Any, Dict
+import orjson
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.exc import SQLAlchemyError
 
 
+# Bodies of the fixed 500 responses, encoded once at import
+_DATABASE_ERROR_BODY = orjson.dumps({"detail": "Database error occurred", "code": "DATABASE_ERROR"})
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error", "code": "INTERNAL_ERROR"})
+
+
 class AppException(Exception):
     """Base application exception."""
 
@@ -29,7 +35,7 @@ class BusinessRuleViolationException(AppException):
         super().__init__(detail, "BUSINESS_RULE_VIOLATION", status.HTTP_400_BAD_REQUEST)
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """Handle application-specific exceptions.
 
     Args:
@@ -39,12 +45,12 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code, content={"detail": exc.detail, "code": exc.code}
     )
 
 
-async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -> Response:
     """Handle SQLAlchemy database exceptions.
 
     Args:
@@ -54,13 +60,14 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
     Returns:
         JSON response with generic database error
     """
-    return JSONResponse(
+    return Response(
+        content=_DATABASE_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": "Database error occurred", "code": "DATABASE_ERROR"},
+        media_type="application/json",
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions.
 
     Args:
@@ -70,7 +77,8 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     Returns:
         JSON response with generic error message
     """
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": "Internal server error", "code": "INTERNAL_ERROR"},
+        media_type="application/json",
     )
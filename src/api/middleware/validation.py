@@ -2,13 +2,13 @@
 from typing import Any, Dict
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors.
 
     Args:
@@ -18,12 +18,12 @@ async def validation_exception_handler(
     Returns:
         JSON response with formatted validation errors
     """
-    errors = []
-    for error in exc.errors():
-        field = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({"field": field, "message": error["msg"], "type": error["type"]})
+    errors = [
+        {"field": " -> ".join(map(str, error["loc"])), "message": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={"detail": "Validation error", "code": "VALIDATION_ERROR", "errors": errors},
     )
@@ -79,10 +79,8 @@ async def get_current_user_info(
     Returns:
         Current user information
     """
-    from uuid import UUID
-
     service = AuthService(db)
-    user = await service.get_user_by_id(UUID(current_user["user_id"]))
+    user = await service.get_user_by_id(current_user["user_id"])
 
     return UserResponse(
         id=str(user.id),
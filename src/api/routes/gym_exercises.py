@@ -4,7 +4,6 @@ from uuid import UUID
 from datetime import date
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-import math
 
 from src.core.database import get_db
 from src.api.middleware.auth import get_current_user
@@ -13,6 +12,8 @@ from src.api.schemas.gym_exercise_schemas import (
     GymExerciseLogCreate,
     GymExerciseLogUpdate,
     GymExerciseLogResponse,
+    GymExerciseLogBulkDelete,
+    GymExerciseLogBulkDeleteResponse,
     PaginatedGymExerciseLogsResponse,
     PaginationMeta,
 )
@@ -40,10 +41,10 @@ async def create_gym_exercise_log(
     """
     service = GymExerciseService(db)
     exercise_log = await service.create_gym_exercise_log(
-        UUID(current_user["user_id"]), exercise_data
+        current_user["user_id"], exercise_data
     )
 
-    return GymExerciseLogResponse.model_validate(exercise_log)
+    return exercise_log
 
 
 @router.get("/", response_model=PaginatedGymExerciseLogsResponse)
@@ -57,6 +58,8 @@ async def list_gym_exercise_logs(
         le=settings.max_page_size,
         description="Items per page",
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include total_items/total_pages"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -65,8 +68,10 @@ async def list_gym_exercise_logs(
     Args:
         start_date: Optional start date filter
         end_date: Optional end date filter
-        page: Page number (1-based)
+        page: Page number (1-based), ignored when cursor is given
         page_size: Number of items per page
+        cursor: Keyset cursor for constant-cost deep pagination
+        include_total: Whether to count all matching logs
         current_user: Current authenticated user
         db: Database session
 
@@ -76,21 +81,29 @@ async def list_gym_exercise_logs(
     service = GymExerciseService(db)
 
     # Get gym exercise logs with summary
-    gym_exercise_logs, total_count = await service.get_gym_exercise_logs(
-        UUID(current_user["user_id"]),
+    gym_exercise_logs, total_count, next_cursor = await service.get_gym_exercise_logs(
+        current_user["user_id"],
         start_date=start_date,
         end_date=end_date,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     # Calculate pagination metadata
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
+    total_pages = None
+    if total_count is not None:
+        total_pages = -(-total_count // page_size)
 
     return PaginatedGymExerciseLogsResponse(
         gym_exercise_logs=gym_exercise_logs,
         pagination=PaginationMeta(
-            page=page, page_size=page_size, total_items=total_count, total_pages=total_pages
+            page=page,
+            page_size=page_size,
+            total_items=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -113,10 +126,10 @@ async def get_gym_exercise_log(
     """
     service = GymExerciseService(db)
     exercise_log = await service.get_gym_exercise_log_by_id(
-        UUID(current_user["user_id"]), exercise_log_id
+        current_user["user_id"], exercise_log_id
     )
 
-    return GymExerciseLogResponse.model_validate(exercise_log)
+    return exercise_log
 
 
 @router.put("/{exercise_log_id}", response_model=GymExerciseLogResponse)
@@ -139,10 +152,34 @@ async def update_gym_exercise_log(
     """
     service = GymExerciseService(db)
     exercise_log = await service.update_gym_exercise_log(
-        UUID(current_user["user_id"]), exercise_log_id, exercise_data
+        current_user["user_id"], exercise_log_id, exercise_data
     )
 
-    return GymExerciseLogResponse.model_validate(exercise_log)
+    return exercise_log
+
+
+@router.delete("/", response_model=GymExerciseLogBulkDeleteResponse)
+async def delete_gym_exercise_logs(
+    delete_data: GymExerciseLogBulkDelete,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Delete several gym exercise logs in one request.
+
+    Args:
+        delete_data: IDs of the gym exercise logs to delete (at most 100)
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        Number of logs deleted; IDs not owned by the user are skipped
+    """
+    service = GymExerciseService(db)
+    deleted_count = await service.delete_gym_exercise_logs(
+        current_user["user_id"], delete_data.ids
+    )
+
+    return GymExerciseLogBulkDeleteResponse(deleted_count=deleted_count)
 
 
 @router.delete("/{exercise_log_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -159,7 +196,7 @@ async def delete_gym_exercise_log(
         db: Database session
     """
     service = GymExerciseService(db)
-    await service.delete_gym_exercise_log(UUID(current_user["user_id"]), exercise_log_id)
+    await service.delete_gym_exercise_log(current_user["user_id"], exercise_log_id)
 
 
 @router.get("/stats/exercise-names")
@@ -177,7 +214,7 @@ async def get_exercise_names(
         List of unique exercise names
     """
     service = GymExerciseService(db)
-    exercise_names = await service.get_exercise_names(UUID(current_user["user_id"]))
+    exercise_names = await service.get_exercise_names(current_user["user_id"])
 
     return {"exercise_names": exercise_names}
 
@@ -200,7 +237,7 @@ async def get_exercise_trends(
     """
     service = GymExerciseService(db)
     trend_data = await service.get_exercise_trends(
-        UUID(current_user["user_id"]), exercise_name
+        current_user["user_id"], exercise_name
     )
 
     return trend_data
@@ -4,7 +4,6 @@ from uuid import UUID
 from datetime import date
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-import math
 
 from src.core.database import get_db
 from src.api.middleware.auth import get_current_user
@@ -40,10 +39,10 @@ async def create_plan_execution(
     """
     service = PlanExecutionService(db)
     plan_execution = await service.create_plan_execution(
-        UUID(current_user["user_id"]), execution_data
+        current_user["user_id"], execution_data
     )
 
-    return PlanExecutionResponse.model_validate(plan_execution)
+    return plan_execution
 
 
 @router.get("/", response_model=PaginatedPlanExecutionsResponse)
@@ -58,6 +57,8 @@ async def list_plan_executions(
         le=settings.max_page_size,
         description="Items per page",
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include total_items/total_pages"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -67,8 +68,10 @@ async def list_plan_executions(
         plan_id: Optional plan ID filter
         start_date: Optional start date filter
         end_date: Optional end date filter
-        page: Page number (1-based)
+        page: Page number (1-based), ignored when cursor is given
         page_size: Number of items per page
+        cursor: Keyset cursor for constant-cost deep pagination
+        include_total: Whether to count all matching executions
         current_user: Current authenticated user
         db: Database session
 
@@ -78,22 +81,30 @@ async def list_plan_executions(
     service = PlanExecutionService(db)
 
     # Get plan executions with summary
-    plan_executions, total_count = await service.get_plan_executions(
-        UUID(current_user["user_id"]),
+    plan_executions, total_count, next_cursor = await service.get_plan_executions(
+        current_user["user_id"],
         plan_id=plan_id,
         start_date=start_date,
         end_date=end_date,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     # Calculate pagination metadata
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
+    total_pages = None
+    if total_count is not None:
+        total_pages = -(-total_count // page_size)
 
     return PaginatedPlanExecutionsResponse(
         plan_executions=plan_executions,
         pagination=PaginationMeta(
-            page=page, page_size=page_size, total_items=total_count, total_pages=total_pages
+            page=page,
+            page_size=page_size,
+            total_items=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -116,10 +127,10 @@ async def get_plan_execution(
     """
     service = PlanExecutionService(db)
     plan_execution = await service.get_plan_execution_by_id(
-        UUID(current_user["user_id"]), execution_id
+        current_user["user_id"], execution_id
     )
 
-    return PlanExecutionResponse.model_validate(plan_execution)
+    return plan_execution
 
 
 @router.put("/{execution_id}", response_model=PlanExecutionResponse)
@@ -142,10 +153,10 @@ async def update_plan_execution(
     """
     service = PlanExecutionService(db)
     plan_execution = await service.update_plan_execution(
-        UUID(current_user["user_id"]), execution_id, execution_data
+        current_user["user_id"], execution_id, execution_data
     )
 
-    return PlanExecutionResponse.model_validate(plan_execution)
+    return plan_execution
 
 
 @router.delete("/{execution_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -162,4 +173,4 @@ async def delete_plan_execution(
         db: Database session
     """
     service = PlanExecutionService(db)
-    await service.delete_plan_execution(UUID(current_user["user_id"]), execution_id)
+    await service.delete_plan_execution(current_user["user_id"], execution_id)
@@ -13,9 +13,6 @@ from src.api.schemas.plan_member_schemas import (
     PlanLeaderboardResponse,
 )
 from src.api.middleware.error_handler import NotFoundException, AppException
-from src.models.fitness_plan import FitnessPlan
-from src.models.plan_member import PlanMember
-from sqlalchemy import select
 
 router = APIRouter(prefix="/api/v1/plans", tags=["plan-members"])
 
@@ -52,7 +49,7 @@ async def invite_member(
     try:
         member = await service.invite_member(
             plan_id=plan_id,
-            inviter_user_id=UUID(current_user["user_id"]),
+            inviter_user_id=current_user["user_id"],
             invitee_email=invite.user_email,
         )
 
@@ -93,8 +90,10 @@ async def get_plan_members(
     service = PlanMemberService(db)
     members = await service.get_plan_members(plan_id)
 
+    # Fields come straight from DB rows and response_model validates the
+    # list once more on the way out, so skip validation here
     return [
-        PlanMemberResponse(
+        PlanMemberResponse.model_construct(
             id=member.id,
             plan_id=member.plan_id,
             user_id=member.user_id,
@@ -133,34 +132,18 @@ async def get_plan_leaderboard(
     Raises:
         404: Plan not found or user doesn't have access
     """
-    from sqlalchemy import and_, or_
-
-    user_id = UUID(current_user["user_id"])
-
-    # Verify plan exists and user has access (owner or member)
-    result = await db.execute(
-        select(FitnessPlan).where(
-            and_(
-                FitnessPlan.id == plan_id,
-                or_(
-                    FitnessPlan.user_id == user_id,  # User is owner
-                    FitnessPlan.id.in_(  # User is member
-                        select(PlanMember.plan_id).where(PlanMember.user_id == user_id)
-                    )
-                ),
-            )
-        )
-    )
-    plan = result.scalar_one_or_none()
-    if not plan:
-        raise HTTPException(status_code=404, detail="Plan not found")
-
     service = PlanMemberService(db)
-    leaderboard = await service.get_plan_leaderboard(plan_id)
+
+    try:
+        plan_name, leaderboard = await service.get_plan_leaderboard(
+            plan_id, current_user["user_id"]
+        )
+    except NotFoundException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
     return PlanLeaderboardResponse(
         plan_id=plan_id,
-        plan_name=plan.name,
+        plan_name=plan_name,
         leaderboard=leaderboard,
     )
 
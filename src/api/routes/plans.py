@@ -1,16 +1,20 @@
 """API routes for fitness plans."""
-from typing import Optional
+from collections import OrderedDict
+from urllib.parse import quote
+from typing import List, Optional
 from uuid import UUID
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, status, Query
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, Request, status, Query
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from icalendar import Calendar, Event
+from icalendar import Alarm, Calendar, Event
 from icalendar import vRecur
 
 from src.core.database import get_db
+from src.core.etag import build_etag, etag_matches
 from src.core.scheduler import get_scheduler
 from src.api.middleware.auth import get_current_user
+from src.api.middleware.error_handler import NotFoundException
 from src.services.plan_service import PlanService
 from src.services.reminder_service import ReminderService
 from src.services.exercise_service import ExerciseService
@@ -30,14 +34,53 @@ from src.api.schemas.reminder_schemas import (
     ReminderUpdate,
     ReminderResponse,
 )
-from src.models.fitness_plan import PlanStatus
-from src.models.reminder import ReminderFrequency
+from src.models.fitness_plan import FitnessPlan, PlanStatus
+from src.models.reminder import Reminder, ReminderFrequency
 from src.core.config import settings
-import math
 
 
 router = APIRouter(prefix="/plans", tags=["plans"])
 
+# Rendered .ics bodies keyed by ETag, most recently used last
+CALENDAR_CACHE_SIZE = 256
+_calendar_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+# ExerciseResponse fields, all read straight from Exercise attributes
+_EXERCISE_RESPONSE_FIELDS = tuple(ExerciseResponse.model_fields)
+
+# iCalendar BYDAY codes for days_of_week 1 (Monday) through 7 (Sunday)
+_DAY_MAP = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+_WEEKLY_FREQUENCIES = (ReminderFrequency.WEEKLY, ReminderFrequency.CUSTOM)
+
+
+def _plan_detail(plan: FitnessPlan) -> FitnessPlanDetail:
+    """Build the detail response for a plan with exercises and reminders loaded.
+
+    Validation is skipped because the values come from DB rows and the
+    route's response_model validates the result again.
+
+    Args:
+        plan: Fitness plan
+
+    Returns:
+        Plan detail response
+    """
+    return FitnessPlanDetail.model_construct(
+        id=plan.id,
+        name=plan.name,
+        description=plan.description,
+        status=plan.status,
+        exercises=[
+            ExerciseResponse.model_construct(
+                **{field: getattr(exercise, field) for field in _EXERCISE_RESPONSE_FIELDS}
+            )
+            for exercise in plan.exercises
+        ],
+        reminders=[ReminderResponse.from_orm_model(r) for r in plan.reminders],
+        created_at=plan.created_at,
+        updated_at=plan.updated_at,
+    )
+
 
 @router.post("/", response_model=FitnessPlanDetail, status_code=status.HTTP_201_CREATED)
 async def create_fitness_plan(
@@ -56,26 +99,18 @@ async def create_fitness_plan(
         Created fitness plan
     """
     service = PlanService(db)
-    plan = await service.create_plan(UUID(current_user["user_id"]), plan_data)
+    plan = await service.create_plan(current_user["user_id"], plan_data)
 
-    # Build response with exercise count
-    return FitnessPlanDetail(
-        id=plan.id,
-        name=plan.name,
-        description=plan.description,
-        status=plan.status.value,
-        exercises=plan.exercises,
-        reminders=[ReminderResponse.from_orm_model(r) for r in plan.reminders],
-        created_at=plan.created_at,
-        updated_at=plan.updated_at,
-    )
+    return _plan_detail(plan)
 
 
 @router.get("/", response_model=PaginatedPlansResponse)
 async def list_fitness_plans(
-    status_filter: Optional[str] = Query(None, alias="status", description="Filter by plan status"),
+    status_filter: Optional[PlanStatus] = Query(None, alias="status", description="Filter by plan status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(settings.default_page_size, ge=1, le=settings.max_page_size, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: bool = Query(False, description="Include total_items/total_pages"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -83,8 +118,10 @@ async def list_fitness_plans(
 
     Args:
         status_filter: Optional filter by plan status
-        page: Page number (1-based)
+        page: Page number (1-based), ignored when cursor is given
         page_size: Number of items per page
+        cursor: Keyset cursor for constant-cost deep pagination
+        include_total: Whether to count all matching plans
         current_user: Current authenticated user
         db: Database session
 
@@ -93,42 +130,45 @@ async def list_fitness_plans(
     """
     service = PlanService(db)
 
-    # Parse status filter
-    status_enum = None
-    if status_filter:
-        try:
-            status_enum = PlanStatus(status_filter)
-        except ValueError:
-            pass
-
-    plans, total_count = await service.get_user_plans(
-        UUID(current_user["user_id"]), status=status_enum, page=page, page_size=page_size
+    plans, total_count, next_cursor = await service.get_user_plans(
+        current_user["user_id"],
+        status=status_filter,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    # Build summary responses
-    user_id = UUID(current_user["user_id"])
+    # Build summary responses; response_model validates them on the way out
+    user_id = current_user["user_id"]
     plan_summaries = [
-        FitnessPlanSummary(
+        FitnessPlanSummary.model_construct(
             id=plan.id,
             name=plan.name,
             description=plan.description,
-            status=plan.status.value,
-            exercise_count=len(plan.exercises),
+            status=plan.status,
+            exercise_count=exercise_count,
             is_owner=(plan.user_id == user_id),
             owner_email=plan.user.email if plan.user else None,
             created_at=plan.created_at,
             updated_at=plan.updated_at,
         )
-        for plan in plans
+        for plan, exercise_count in plans
     ]
 
     # Calculate pagination metadata
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
+    total_pages = None
+    if total_count is not None:
+        total_pages = -(-total_count // page_size)
 
     return PaginatedPlansResponse(
         plans=plan_summaries,
         pagination=PaginationMeta(
-            page=page, page_size=page_size, total_items=total_count, total_pages=total_pages
+            page=page,
+            page_size=page_size,
+            total_items=total_count,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -150,18 +190,9 @@ async def get_fitness_plan(
         Fitness plan details
     """
     service = PlanService(db)
-    plan = await service.get_plan_by_id(UUID(current_user["user_id"]), plan_id)
+    plan = await service.get_plan_by_id(current_user["user_id"], plan_id)
 
-    return FitnessPlanDetail(
-        id=plan.id,
-        name=plan.name,
-        description=plan.description,
-        status=plan.status.value,
-        exercises=plan.exercises,
-        reminders=[ReminderResponse.from_orm_model(r) for r in plan.reminders],
-        created_at=plan.created_at,
-        updated_at=plan.updated_at,
-    )
+    return _plan_detail(plan)
 
 
 @router.put("/{plan_id}", response_model=FitnessPlanDetail)
@@ -183,18 +214,9 @@ async def update_fitness_plan(
         Updated fitness plan
     """
     service = PlanService(db)
-    plan = await service.update_plan(UUID(current_user["user_id"]), plan_id, plan_data)
+    plan = await service.update_plan(current_user["user_id"], plan_id, plan_data)
 
-    return FitnessPlanDetail(
-        id=plan.id,
-        name=plan.name,
-        description=plan.description,
-        status=plan.status.value,
-        exercises=plan.exercises,
-        reminders=[ReminderResponse.from_orm_model(r) for r in plan.reminders],
-        created_at=plan.created_at,
-        updated_at=plan.updated_at,
-    )
+    return _plan_detail(plan)
 
 
 @router.delete("/{plan_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -212,7 +234,7 @@ async def delete_fitness_plan(
     """
     scheduler = get_scheduler()
     service = PlanService(db)
-    await service.delete_plan(UUID(current_user["user_id"]), plan_id, scheduler)
+    await service.delete_plan(current_user["user_id"], plan_id, scheduler)
 
 
 # ========== Exercise Endpoints ==========
@@ -242,10 +264,10 @@ async def add_exercise_to_plan(
     """
     service = ExerciseService(db)
     exercise = await service.add_exercise(
-        UUID(current_user["user_id"]), plan_id, exercise_data
+        current_user["user_id"], plan_id, exercise_data
     )
 
-    return ExerciseResponse.model_validate(exercise)
+    return exercise
 
 
 @router.put("/{plan_id}/exercises/{exercise_id}", response_model=ExerciseResponse)
@@ -270,10 +292,10 @@ async def update_exercise(
     """
     service = ExerciseService(db)
     exercise = await service.update_exercise(
-        UUID(current_user["user_id"]), plan_id, exercise_id, exercise_data
+        current_user["user_id"], plan_id, exercise_id, exercise_data
     )
 
-    return ExerciseResponse.model_validate(exercise)
+    return exercise
 
 
 @router.delete(
@@ -294,7 +316,7 @@ async def delete_exercise(
         db: Database session
     """
     service = ExerciseService(db)
-    await service.delete_exercise(UUID(current_user["user_id"]), plan_id, exercise_id)
+    await service.delete_exercise(current_user["user_id"], plan_id, exercise_id)
 
 
 # ========== Reminder Endpoints ==========
@@ -325,7 +347,7 @@ async def create_reminder(
     scheduler = get_scheduler()
     service = ReminderService(db, scheduler)
     reminder = await service.create_reminder(
-        UUID(current_user["user_id"]), plan_id, reminder_data
+        current_user["user_id"], plan_id, reminder_data
     )
 
     return ReminderResponse.from_orm_model(reminder)
@@ -354,7 +376,7 @@ async def update_reminder(
     scheduler = get_scheduler()
     service = ReminderService(db, scheduler)
     reminder = await service.update_reminder(
-        UUID(current_user["user_id"]), plan_id, reminder_id, reminder_data
+        current_user["user_id"], plan_id, reminder_id, reminder_data
     )
 
     return ReminderResponse.from_orm_model(reminder)
@@ -379,38 +401,44 @@ async def delete_reminder(
     """
     scheduler = get_scheduler()
     service = ReminderService(db, scheduler)
-    await service.delete_reminder(UUID(current_user["user_id"]), plan_id, reminder_id)
+    await service.delete_reminder(current_user["user_id"], plan_id, reminder_id)
 
 
 # ========== Calendar Export Endpoint ==========
 
 
-@router.get("/{plan_id}/export/calendar")
-async def export_plan_calendar(
-    plan_id: UUID,
-    current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    """Export fitness plan reminders as an iCalendar (.ics) file.
+def _calendar_etag(plan: FitnessPlan, reminders: List[Reminder], today: date) -> str:
+    """Build a strong ETag covering everything the exported calendar renders.
 
     Args:
-        plan_id: ID of the plan
-        current_user: Current authenticated user
-        db: Database session
+        plan: Plan with exercises loaded
+        reminders: Plan reminders
+        today: Date the recurring events start from
 
     Returns:
-        iCalendar file for download
+        Quoted ETag value
     """
-    # Get plan details
-    plan_service = PlanService(db)
-    plan = await plan_service.get_plan_by_id(UUID(current_user["user_id"]), plan_id)
-
-    # Get reminders
-    reminder_service = ReminderService(db)
-    reminders = await reminder_service.get_plan_reminders(
-        UUID(current_user["user_id"]), plan_id
+    return build_etag(
+        plan.id,
+        plan.name,
+        plan.updated_at,
+        today.isoformat(),
+        *(f"{ex.id}:{ex.name}:{ex.duration_minutes}:{ex.repetitions}" for ex in plan.exercises),
+        *(f"{r.id}:{r.updated_at}" for r in reminders),
     )
 
+
+def _build_calendar(plan: FitnessPlan, reminders: List[Reminder], today: date) -> bytes:
+    """Render a plan's enabled reminders as an iCalendar document.
+
+    Args:
+        plan: Plan with exercises loaded
+        reminders: Plan reminders
+        today: Date the recurring events start from
+
+    Returns:
+        Serialized .ics content
+    """
     # Create calendar
     cal = Calendar()
     cal.add("prodid", "-//Fitness Plan Reminder//mxm.dk//")
@@ -418,6 +446,14 @@ async def export_plan_calendar(
     cal.add("x-wr-calname", f"{plan.name} - 健身计划提醒")
     cal.add("x-wr-timezone", "Asia/Shanghai")
 
+    # Build description with exercises, shared by every event
+    exercise_list = "\n".join([
+        f"- {ex.name} ({ex.duration_minutes}分钟)" if ex.duration_minutes
+        else f"- {ex.name} ({ex.repetitions}次)"
+        for ex in plan.exercises
+    ])
+    description = f"健身计划提醒\n\n锻炼项目：\n{exercise_list}"
+
     # Add events for each reminder
     for reminder in reminders:
         if not reminder.is_enabled:
@@ -425,41 +461,24 @@ async def export_plan_calendar(
 
         event = Event()
         event.add("summary", f"🏋️ {plan.name}")
-
-        # Build description with exercises
-        exercise_list = "\n".join([
-            f"- {ex.name} ({ex.duration_minutes}分钟)" if ex.duration_minutes
-            else f"- {ex.name} ({ex.repetitions}次)"
-            for ex in plan.exercises
-        ])
-        event.add("description", f"健身计划提醒\n\n锻炼项目：\n{exercise_list}")
+        event.add("description", description)
 
         # Set start time (today at reminder time)
-        now = datetime.now()
-        start_time = datetime.combine(now.date(), reminder.reminder_time)
+        start_time = datetime.combine(today, reminder.reminder_time)
         event.add("dtstart", start_time)
         event.add("dtend", start_time + timedelta(hours=1))
 
-        # Add recurrence rule based on frequency
+        # Add recurrence rule based on frequency (custom repeats weekly too)
         if reminder.frequency == ReminderFrequency.DAILY:
             event.add("rrule", {"freq": "daily"})
-        elif reminder.frequency == ReminderFrequency.WEEKLY and reminder.days_of_week:
-            # Convert days (1=Monday, 7=Sunday) to iCalendar format
-            # iCalendar uses: MO, TU, WE, TH, FR, SA, SU
-            day_map = {1: "MO", 2: "TU", 3: "WE", 4: "TH", 5: "FR", 6: "SA", 7: "SU"}
-            byday = [day_map[day] for day in reminder.days_of_week if day in day_map]
-            event.add("rrule", {"freq": "weekly", "byday": byday})
-        elif reminder.frequency == ReminderFrequency.CUSTOM and reminder.days_of_week:
-            # Same as weekly
-            day_map = {1: "MO", 2: "TU", 3: "WE", 4: "TH", 5: "FR", 6: "SA", 7: "SU"}
-            byday = [day_map[day] for day in reminder.days_of_week if day in day_map]
+        elif reminder.frequency in _WEEKLY_FREQUENCIES and reminder.days_of_week:
+            byday = [_DAY_MAP[day - 1] for day in reminder.days_of_week if 1 <= day <= 7]
             event.add("rrule", {"freq": "weekly", "byday": byday})
 
         # Add unique ID
-        event.add("uid", f"{plan_id}-{reminder.id}@fitness-plan")
+        event.add("uid", f"{plan.id}-{reminder.id}@fitness-plan")
 
         # Add alarm (15 minutes before)
-        from icalendar import Alarm
         alarm = Alarm()
         alarm.add("action", "DISPLAY")
         alarm.add("description", f"健身提醒: {plan.name}")
@@ -468,10 +487,54 @@ async def export_plan_calendar(
 
         cal.add_component(event)
 
+    return cal.to_ical()
+
+
+@router.get("/{plan_id}/export/calendar")
+async def export_plan_calendar(
+    plan_id: UUID,
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Export fitness plan reminders as an iCalendar (.ics) file.
+
+    Responses carry an ETag; a matching If-None-Match returns 304 Not Modified.
+
+    Args:
+        plan_id: ID of the plan
+        request: Incoming request, for the If-None-Match header
+        current_user: Current authenticated user
+        db: Database session
+
+    Returns:
+        iCalendar file for download
+    """
+    # Get plan details; reminders are loaded with the plan
+    plan_service = PlanService(db)
+    plan = await plan_service.get_plan_by_id(current_user["user_id"], plan_id)
+
+    # Only the owner can export reminders
+    if plan.user_id != current_user["user_id"]:
+        raise NotFoundException("Fitness plan not found")
+    reminders = plan.reminders
+
+    today = date.today()
+    etag = _calendar_etag(plan, reminders, today)
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    ics_content = _calendar_cache.get(etag)
+    if ics_content is None:
+        ics_content = _build_calendar(plan, reminders, today)
+        _calendar_cache[etag] = ics_content
+        if len(_calendar_cache) > CALENDAR_CACHE_SIZE:
+            _calendar_cache.popitem(last=False)
+    else:
+        _calendar_cache.move_to_end(etag)
+
     # Return as downloadable file
-    ics_content = cal.to_ical()
     # Use ASCII-safe filename and RFC 5987 encoding for Chinese characters
-    from urllib.parse import quote
     safe_filename = "fitness_plan_calendar.ics"
     encoded_filename = quote(f"{plan.name}_calendar.ics".encode('utf-8'))
 
@@ -479,6 +542,7 @@ async def export_plan_calendar(
         content=ics_content,
         media_type="text/calendar",
         headers={
-            "Content-Disposition": f'attachment; filename="{safe_filename}"; filename*=UTF-8\'\'{encoded_filename}'
+            "Content-Disposition": f'attachment; filename="{safe_filename}"; filename*=UTF-8\'\'{encoded_filename}',
+            "ETag": etag,
         },
     )
@@ -1,12 +1,13 @@
 """API routes for workout logs."""
-from typing import Optional
+from collections import OrderedDict
+from typing import List, Optional
 from uuid import UUID
 from datetime import date
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-import math
 
 from src.core.database import get_db
+from src.core.etag import build_etag, etag_matches
 from src.api.middleware.auth import get_current_user
 from src.services.workout_log_service import WorkoutLogService
 from src.api.schemas.workout_log_schemas import (
@@ -14,15 +15,19 @@ from src.api.schemas.workout_log_schemas import (
     WorkoutLogUpdate,
     WorkoutLogResponse,
     PaginatedWorkoutLogsResponse,
-    PaginationMeta,
     ChartData,
     ChartDataPoint,
+    PeriodType,
 )
 from src.core.config import settings
 
 
 router = APIRouter(prefix="/workout-logs", tags=["workout-logs"])
 
+# Aggregated chart data points keyed by ETag, most recently used last
+CHART_CACHE_SIZE = 256
+_chart_cache: "OrderedDict[str, List[ChartDataPoint]]" = OrderedDict()
+
 
 @router.post("/", response_model=WorkoutLogResponse, status_code=status.HTTP_201_CREATED)
 async def create_workout_log(
@@ -42,22 +47,30 @@ async def create_workout_log(
     """
     service = WorkoutLogService(db)
     workout_log = await service.create_workout_log(
-        UUID(current_user["user_id"]), workout_data
+        current_user["user_id"], workout_data
     )
 
-    return WorkoutLogResponse.model_validate(workout_log)
+    return workout_log
 
 
 @router.get("/chart-data", response_model=ChartData)
 async def get_workout_chart_data(
-    period_type: str = Query("week", regex="^(week|month)$", description="Chart period type"),
+    request: Request,
+    response: Response,
+    period_type: PeriodType = Query(PeriodType.WEEK, description="Chart period type"),
     limit: int = Query(12, ge=1, le=24, description="Number of periods"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get aggregated workout data for charts.
 
+    Responses carry an ETag; a matching If-None-Match returns 304 Not Modified
+    without running the aggregation, and recently computed aggregations are
+    reused while the user's logs are unchanged.
+
     Args:
+        request: Incoming request, read for If-None-Match
+        response: Outgoing response, used to set caching headers
         period_type: "week" or "month"
         limit: Number of periods to return
         current_user: Current authenticated user
@@ -67,14 +80,29 @@ async def get_workout_chart_data(
         Chart data with aggregated statistics
     """
     service = WorkoutLogService(db)
-    data_points_dict = await service.get_chart_data(
-        UUID(current_user["user_id"]), period_type=period_type, limit=limit
-    )
-
-    # Convert dict to ChartDataPoint objects
-    data_points = [ChartDataPoint(**dp) for dp in data_points_dict]
-
-    return ChartData(data_points=data_points, period_type=period_type)
+    user_id = current_user["user_id"]
+
+    log_count, last_updated = await service.get_chart_version(user_id)
+    etag = build_etag(user_id, period_type.value, limit, log_count, last_updated)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+    # The ETag covers every input of the aggregation, so cached points for
+    # it are still current
+    data_points = _chart_cache.get(etag)
+    if data_points is None:
+        data_points = await service.get_chart_data(
+            user_id, period_type=period_type.value, limit=limit
+        )
+        _chart_cache[etag] = data_points
+        if len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    else:
+        _chart_cache.move_to_end(etag)
+
+    return ChartData.model_construct(data_points=data_points, period_type=period_type)
 
 
 @router.get("/", response_model=PaginatedWorkoutLogsResponse)
@@ -88,6 +116,7 @@ async def list_workout_logs(
         le=settings.max_page_size,
         description="Items per page",
     ),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -96,8 +125,9 @@ async def list_workout_logs(
     Args:
         start_date: Optional start date filter
         end_date: Optional end date filter
-        page: Page number (1-based)
+        page: Page number (1-based), ignored when cursor is given
         page_size: Number of items per page
+        cursor: Keyset cursor for constant-cost deep pagination
         current_user: Current authenticated user
         db: Database session
 
@@ -106,30 +136,40 @@ async def list_workout_logs(
     """
     service = WorkoutLogService(db)
 
+    # Get statistics; total_workouts is the row count under the same
+    # filters, so the page query can skip its own COUNT
+    stats = await service.get_workout_stats(
+        current_user["user_id"], start_date=start_date, end_date=end_date
+    )
+    total_count = stats.total_workouts
+
     # Get workout logs
-    workout_logs, total_count = await service.get_workout_logs(
-        UUID(current_user["user_id"]),
+    workout_logs, _, next_cursor = await service.get_workout_logs(
+        current_user["user_id"],
         start_date=start_date,
         end_date=end_date,
         page=page,
         page_size=page_size,
-    )
-
-    # Get statistics
-    stats = await service.get_workout_stats(
-        UUID(current_user["user_id"]), start_date=start_date, end_date=end_date
+        cursor=cursor,
+        include_total=False,
     )
 
     # Calculate pagination metadata
-    total_pages = math.ceil(total_count / page_size) if total_count > 0 else 0
-
-    return PaginatedWorkoutLogsResponse(
-        workout_logs=[WorkoutLogResponse.model_validate(log) for log in workout_logs],
-        pagination=PaginationMeta(
-            page=page, page_size=page_size, total_items=total_count, total_pages=total_pages
-        ),
-        stats=stats,
-    )
+    total_pages = -(-total_count // page_size)
+
+    # response_model validates the ORM rows once; building the response
+    # models here would have FastAPI dump and re-validate them.
+    return {
+        "workout_logs": workout_logs,
+        "pagination": {
+            "page": page,
+            "page_size": page_size,
+            "total_items": total_count,
+            "total_pages": total_pages,
+            "next_cursor": next_cursor,
+        },
+        "stats": stats,
+    }
 
 
 @router.get("/{workout_log_id}", response_model=WorkoutLogResponse)
@@ -150,10 +190,10 @@ async def get_workout_log(
     """
     service = WorkoutLogService(db)
     workout_log = await service.get_workout_log_by_id(
-        UUID(current_user["user_id"]), workout_log_id
+        current_user["user_id"], workout_log_id
     )
 
-    return WorkoutLogResponse.model_validate(workout_log)
+    return workout_log
 
 
 @router.put("/{workout_log_id}", response_model=WorkoutLogResponse)
@@ -176,10 +216,10 @@ async def update_workout_log(
     """
     service = WorkoutLogService(db)
     workout_log = await service.update_workout_log(
-        UUID(current_user["user_id"]), workout_log_id, workout_data
+        current_user["user_id"], workout_log_id, workout_data
     )
 
-    return WorkoutLogResponse.model_validate(workout_log)
+    return workout_log
 
 
 @router.delete("/{workout_log_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -196,4 +236,4 @@ async def delete_workout_log(
         db: Database session
     """
     service = WorkoutLogService(db)
-    await service.delete_workout_log(UUID(current_user["user_id"]), workout_log_id)
+    await service.delete_workout_log(current_user["user_id"], workout_log_id)
@@ -57,6 +57,18 @@ class GymExerciseLogUpdate(BaseModel):
     sets: Optional[list[GymExerciseSetCreate]] = Field(None, min_items=1)
 
 
+class GymExerciseLogBulkDelete(BaseModel):
+    """Schema for deleting several gym exercise logs."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=100, description="Log IDs to delete")
+
+
+class GymExerciseLogBulkDeleteResponse(BaseModel):
+    """Schema for bulk delete result."""
+
+    deleted_count: int
+
+
 class GymExerciseLogResponse(BaseModel):
     """Schema for gym exercise log response."""
 
@@ -91,8 +103,9 @@ class PaginationMeta(BaseModel):
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class PaginatedGymExerciseLogsResponse(BaseModel):
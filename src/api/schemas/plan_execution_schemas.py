@@ -95,8 +95,9 @@ class PaginationMeta(BaseModel):
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class PaginatedPlanExecutionsResponse(BaseModel):
@@ -2,7 +2,7 @@
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator
 from src.models.fitness_plan import PlanStatus
 from src.models.exercise import ExerciseIntensity
 from src.api.schemas.reminder_schemas import ReminderResponse
@@ -58,14 +58,6 @@ class FitnessPlanCreate(BaseModel):
     description: Optional[str] = Field(None, description="Plan description")
     exercises: List[ExerciseCreate] = Field(..., min_length=1, description="List of exercises")
 
-    @field_validator('exercises')
-    @classmethod
-    def validate_exercises_not_empty(cls, v):
-        """Validate that at least one exercise is provided."""
-        if not v or len(v) == 0:
-            raise ValueError("Plan must contain at least one exercise")
-        return v
-
 
 class FitnessPlanUpdate(BaseModel):
     """Schema for updating a fitness plan."""
@@ -111,8 +103,9 @@ class PaginationMeta(BaseModel):
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int] = None
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class PaginatedPlansResponse(BaseModel):
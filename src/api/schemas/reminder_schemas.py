@@ -43,12 +43,6 @@ class ReminderCreate(BaseModel):
         # Remove duplicates and sort
         return sorted(list(set(v)))
 
-    @field_validator("frequency")
-    @classmethod
-    def validate_frequency_with_days(cls, v: ReminderFrequency) -> ReminderFrequency:
-        """Validate frequency value."""
-        return v
-
 
 class ReminderUpdate(BaseModel):
     """Schema for updating an existing reminder."""
@@ -83,7 +77,7 @@ class ReminderResponse(BaseModel):
 
     id: UUID
     plan_id: UUID
-    reminder_time: str  # Returned as string in HH:MM:SS format
+    reminder_time: time  # Serialized as HH:MM:SS
     frequency: str
     days_of_week: Optional[List[int]] = None
     is_enabled: bool
@@ -94,12 +88,12 @@ class ReminderResponse(BaseModel):
 
     @classmethod
     def from_orm_model(cls, reminder):
-        """Convert ORM model to response schema."""
-        return cls(
+        """Convert ORM model to response schema without re-validating its fields."""
+        return cls.model_construct(
             id=reminder.id,
             plan_id=reminder.plan_id,
-            reminder_time=str(reminder.reminder_time),
-            frequency=reminder.frequency.value if hasattr(reminder.frequency, "value") else reminder.frequency,
+            reminder_time=reminder.reminder_time,
+            frequency=reminder.frequency,
             days_of_week=reminder.days_of_week,
             is_enabled=reminder.is_enabled,
             created_at=reminder.created_at,
@@ -3,6 +3,7 @@ from typing import Optional
 from datetime import datetime, date
 from uuid import UUID
 from pydantic import BaseModel, Field
+from enum import Enum
 
 
 # Workout Log Schemas
@@ -54,6 +55,13 @@ class WorkoutStats(BaseModel):
 
 
 # Chart Data Schema
+class PeriodType(str, Enum):
+    """Chart aggregation period options."""
+
+    WEEK = "week"
+    MONTH = "month"
+
+
 class ChartDataPoint(BaseModel):
     """Schema for a single chart data point."""
 
@@ -68,7 +76,7 @@ class ChartData(BaseModel):
     """Schema for chart data."""
 
     data_points: list[ChartDataPoint]
-    period_type: str  # "week" or "month"
+    period_type: PeriodType
 
 
 # Pagination Schema
@@ -79,6 +87,7 @@ class PaginationMeta(BaseModel):
     page_size: int
     total_items: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class PaginatedWorkoutLogsResponse(BaseModel):
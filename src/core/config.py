@@ -19,6 +19,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20  # Connections kept open in the PostgreSQL pool
+    db_max_overflow: int = 10  # Extra connections allowed under burst load
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
 
     # Redis (使用 memory:// 可以不依赖 Redis 服务)
     redis_url: str = "memory://"
@@ -29,6 +32,9 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # Password hashing
+    bcrypt_rounds: int = 12  # log2 of the bcrypt work factor
+
     # API
     api_v1_prefix: str = "/api/v1"
     cors_origins: List[str] = ["*"]  # 允许所有来源访问（局域网分享）
@@ -1,5 +1,7 @@
 """Database connection and session management."""
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from src.core.config import settings
@@ -13,14 +15,26 @@ if settings.database_url.startswith("sqlite"):
         echo=settings.app_env == "development",
         connect_args={"check_same_thread": False},
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        """Use WAL with relaxed fsync and larger in-memory caches on each connection."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 else:
     # PostgreSQL configuration (full mode)
     engine = create_async_engine(
         settings.database_url,
         echo=settings.app_env == "development",
-        pool_size=10,
-        max_overflow=20,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
         pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle,
     )
 
 # Create async session factory
@@ -50,3 +64,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def warm_pool() -> None:
+    """Open the PostgreSQL pool's connections before serving traffic.
+
+    The checkouts overlap, so each one opens its own connection; they then
+    sit idle in the pool and early requests skip the connect handshake.
+    SQLite connections are local and cheap, so nothing is done there.
+    """
+    if settings.database_url.startswith("sqlite"):
+        return
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(settings.db_pool_size)))
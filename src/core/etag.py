@@ -0,0 +1,34 @@
+"""Strong ETag construction and If-None-Match matching for conditional GETs."""
+import hashlib
+from typing import Any, Optional
+
+
+def build_etag(*parts: Any) -> str:
+    """Hash everything a response depends on into a strong ETag.
+
+    Args:
+        parts: Values the response body is derived from
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check whether an If-None-Match header covers the current ETag.
+
+    Weak prefixes are ignored, and ``*`` matches any ETag.
+
+    Args:
+        etag: Current quoted ETag
+        if_none_match: Raw If-None-Match header value
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
@@ -0,0 +1,97 @@
+"""Opaque cursors and query helpers for keyset pagination."""
+import base64
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        values: Sort key values; dates and datetimes are stored in ISO format
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = "|".join(
+        value.isoformat() if hasattr(value, "isoformat") else str(value) for value in values
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parts: int) -> List[str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from the client
+        parts: Expected number of sort key values
+
+    Returns:
+        Sort key values as strings
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    values = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+    if len(values) != parts:
+        raise ValueError("Malformed cursor")
+    return values
+
+
+def apply_keyset_page(
+    query: Select,
+    sort_key: Sequence[Any],
+    parsers: Sequence[Callable[[str], Any]],
+    page: int,
+    page_size: int,
+    cursor: Optional[str] = None,
+) -> Select:
+    """Order a query newest-first on sort_key and restrict it to one page.
+
+    With a cursor the query seeks past the row the cursor was built from;
+    otherwise it falls back to OFFSET for ``page``. One extra row is fetched
+    so split_keyset_page can tell whether another page follows.
+
+    Args:
+        query: Select statement with filters applied
+        sort_key: Columns ordering the rows, ending with a unique column
+        parsers: Converters from cursor strings to each sort key column's type
+        page: Page number (1-based), ignored when cursor is given
+        page_size: Items per page
+        cursor: Cursor from a previous page's next_cursor
+
+    Returns:
+        Paginated select statement
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = query.order_by(*(column.desc() for column in sort_key)).limit(page_size + 1)
+    if cursor:
+        values = decode_cursor(cursor, len(sort_key))
+        after = tuple(parse(value) for parse, value in zip(parsers, values))
+        return query.where(tuple_(*sort_key) < after)
+    return query.offset((page - 1) * page_size)
+
+
+def split_keyset_page(
+    rows: List[Any], sort_key: Sequence[Any], page_size: int
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim the extra row fetched by apply_keyset_page and build next_cursor.
+
+    Args:
+        rows: Entities returned by the paginated query, or tuples whose
+            first element is the entity when extra columns were selected
+        sort_key: Columns the query was ordered by
+        page_size: Items per page
+
+    Returns:
+        Tuple of (rows for this page, cursor for the next page or None)
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1][0] if isinstance(rows[-1], tuple) else rows[-1]
+    return rows, encode_cursor(*(getattr(last, column.key) for column in sort_key))
@@ -1,7 +1,10 @@
 """Global scheduler instance for the application."""
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+if TYPE_CHECKING:
+    from apscheduler.jobstores.redis import RedisJobStore
+
 # Global scheduler instance
 _scheduler: Optional[AsyncIOScheduler] = None
 
@@ -23,3 +26,26 @@ def get_scheduler() -> Optional[AsyncIOScheduler]:
         AsyncIOScheduler instance or None if not initialized
     """
     return _scheduler
+
+
+def create_redis_job_store(redis_url: str) -> "RedisJobStore":
+    """Create a Redis job store connected to the given URL.
+
+    The client is built with ``Redis.from_url``, which understands every
+    URL form redis-py supports (``redis://``, ``rediss://`` and ``unix://``,
+    with credentials and query options). RedisJobStore itself only accepts
+    ``Redis(...)`` keyword arguments, so its own client is replaced.
+    redis is imported here so memory-only deployments don't need it.
+
+    Args:
+        redis_url: Redis connection URL
+
+    Returns:
+        RedisJobStore using a client for redis_url
+    """
+    from apscheduler.jobstores.redis import RedisJobStore
+    from redis import Redis
+
+    store = RedisJobStore()
+    store.redis = Redis.from_url(redis_url)
+    return store
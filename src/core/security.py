@@ -1,13 +1,33 @@
 """Security utilities for JWT and password hashing."""
+import base64
+import calendar
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
+import bcrypt
+import orjson
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from src.core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only reads the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+# Decoded payloads of recently verified tokens, most recently used last
+TOKEN_CACHE_SIZE = 1024
+_token_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# HMAC keyed once with the JWT secret; copied per verification
+_hs256_mac = hmac.new(settings.jwt_secret_key.encode(), digestmod=hashlib.sha256)
+
+# Encoded JOSE header shared by every HS256 token we issue
+_HS256_HEADER_SEGMENT = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+# Registered claims the HS256 fast path does not validate itself
+_JOSE_VALIDATED_CLAIMS = frozenset({"nbf", "iat", "aud", "iss", "sub", "jti", "at_hash"})
 
 
 def hash_password(password: str) -> str:
@@ -19,7 +39,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8")[:_BCRYPT_MAX_BYTES], salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -32,7 +53,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8")[:_BCRYPT_MAX_BYTES], hashed_password.encode()
+    )
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -53,21 +76,131 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
 
     to_encode.update({"exp": expire})
+    if settings.jwt_algorithm == "HS256":
+        return _encode_hs256(to_encode)
     encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 
+def _b64url_encode(data: bytes) -> bytes:
+    """Encode bytes as an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _encode_hs256(claims: Dict[str, Any]) -> str:
+    """Sign an HS256 token with the prebuilt header and HMAC key.
+
+    Datetime values of the time claims are converted to Unix timestamps the
+    same way jose does.
+
+    Args:
+        claims: Token payload
+
+    Returns:
+        Encoded JWT token
+    """
+    for claim in ("exp", "iat", "nbf"):
+        value = claims.get(claim)
+        if isinstance(value, datetime):
+            claims[claim] = calendar.timegm(value.utctimetuple())
+
+    signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url_encode(orjson.dumps(claims))
+    mac = _hs256_mac.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url_encode(mac.digest())).decode()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _check_exp(payload: Dict[str, Any]) -> None:
+    """Reject a payload whose ``exp`` claim is malformed or in the past.
+
+    Raises:
+        JWTError: If the token has expired or exp is not an integer
+    """
+    if "exp" not in payload:
+        return
+    try:
+        exp = int(payload["exp"])
+    except (TypeError, ValueError):
+        raise JWTError("Expiration Time claim (exp) must be an integer")
+    if exp < int(time.time()):
+        raise JWTError("Signature has expired")
+
+
+def _decode_hs256(token: str) -> Dict[str, Any]:
+    """Verify and decode an HS256 token without jose's generic dispatch.
+
+    Tokens carrying claims other than ``exp`` are handed to jose so those
+    claims keep their full validation.
+
+    Args:
+        token: JWT token to verify
+
+    Returns:
+        Decoded payload
+
+    Raises:
+        JWTError: If the token is malformed, tampered with or expired
+    """
+    signing_input, _, signature = token.rpartition(".")
+    header_segment, _, payload_segment = signing_input.partition(".")
+    try:
+        header = orjson.loads(_b64url_decode(header_segment))
+        payload = orjson.loads(_b64url_decode(payload_segment))
+        signature_bytes = _b64url_decode(signature)
+    except ValueError:
+        raise JWTError("Malformed token")
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise JWTError("Unexpected token algorithm")
+
+    mac = _hs256_mac.copy()
+    mac.update(signing_input.encode())
+    if not hmac.compare_digest(mac.digest(), signature_bytes):
+        raise JWTError("Signature verification failed")
+
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload")
+    if not _JOSE_VALIDATED_CLAIMS.isdisjoint(payload):
+        return jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+
+    _check_exp(payload)
+    return payload
+
+
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify and decode a JWT token.
 
+    Successfully verified tokens are cached until their ``exp`` claim passes,
+    so repeat requests with the same token skip the signature check.
+
     Args:
         token: JWT token to verify
 
     Returns:
         Decoded payload if valid, None otherwise
     """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            _token_cache.move_to_end(token)
+            return cached
+        del _token_cache[token]
+
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
+        if settings.jwt_algorithm == "HS256":
+            payload = _decode_hs256(token)
+        else:
+            payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
     except JWTError:
         return None
+
+    if "exp" in payload:
+        _token_cache[token] = payload
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return payload
@@ -1,16 +1,19 @@
 """FastAPI application entry point."""
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from sqlalchemy.exc import SQLAlchemyError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.jobstores.redis import RedisJobStore
 from pathlib import Path
+from functools import lru_cache
 
 from src.core.config import settings
-from src.core.scheduler import set_scheduler, get_scheduler
+from src.core.database import warm_pool
+from src.core.scheduler import create_redis_job_store, set_scheduler, get_scheduler
+from src.services.auth_service import dummy_password_hash
 from src.api.middleware.validation import validation_exception_handler
 from src.api.middleware.error_handler import (
     AppException,
@@ -28,6 +31,10 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
+    # Paths missing their trailing slash used to fall through to the root
+    # static mount and 404; keep that instead of answering with a redirect
+    redirect_slashes=False,
 )
 
 # CORS configuration
@@ -54,9 +61,28 @@ app.include_router(gym_exercises.router, prefix=settings.api_v1_prefix)
 app.include_router(plan_execution_routes.router, prefix=settings.api_v1_prefix)
 app.include_router(plan_member_routes.router)
 
-# 挂载静态文件目录（必须在最后，因为包含根路径）
+# Frontend assets live under /static so unmatched API paths 404 without
+# touching the filesystem; put a reverse proxy or CDN in front in production
 static_path = Path(__file__).parent.parent / "static"
-app.mount("/", StaticFiles(directory=str(static_path), html=True), name="static")
+app.mount("/static", StaticFiles(directory=str(static_path), html=True), name="static")
+
+
+@lru_cache(maxsize=1)
+def _index_html() -> bytes:
+    """Read the frontend entry page once per process."""
+    return (static_path / "index.html").read_bytes()
+
+
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def index():
+    """Serve the frontend entry page."""
+    return HTMLResponse(_index_html())
+
+
+@app.get("/{page}.html", include_in_schema=False)
+async def legacy_page(page: str):
+    """Redirect page URLs from before the /static prefix."""
+    return RedirectResponse(f"/static/{page}.html", status_code=301)
 
 
 @app.on_event("startup")
@@ -66,6 +92,15 @@ async def startup_event():
     print(f"📝 Environment: {settings.app_env}")
     print(f"📖 API Documentation: http://localhost:8000/docs")
 
+    # Open database connections up front (PostgreSQL only)
+    try:
+        await warm_pool()
+    except Exception as e:
+        print(f"⚠️ Failed to warm database pool: {e}")
+
+    # Build the unknown-email login hash before the first request needs it
+    await asyncio.to_thread(dummy_password_hash)
+
     # Initialize APScheduler
     try:
         # Configure job store (Redis or Memory)
@@ -74,14 +109,8 @@ async def startup_event():
             print("📦 Using memory job store (lightweight mode)")
             scheduler = AsyncIOScheduler(timezone="Asia/Shanghai")
         else:
-            # 完整版：使用 Redis 存储
-            jobstores = {
-                "default": RedisJobStore(
-                    host=settings.redis_url.split("://")[1].split(":")[0],
-                    port=int(settings.redis_url.split(":")[-1].split("/")[0]),
-                    db=int(settings.redis_url.split("/")[-1]) if "/" in settings.redis_url else 0,
-                )
-            }
+            # 完整版：使用 Redis 存储（仅在此时导入 redis）
+            jobstores = {"default": create_redis_job_store(settings.redis_url)}
             scheduler = AsyncIOScheduler(jobstores=jobstores, timezone="Asia/Shanghai")
 
         scheduler.start()
@@ -1,10 +1,9 @@
 """Exercise model."""
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Enum, TIMESTAMP, ForeignKey, CheckConstraint
+from sqlalchemy import Column, String, Integer, TIMESTAMP, ForeignKey, CheckConstraint
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 import enum
 
 
@@ -21,18 +20,14 @@ class Exercise(Base):
 
     __tablename__ = "exercise"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     plan_id = Column(
         GUID(), ForeignKey("fitness_plan.id"), nullable=False, index=True
     )
     name = Column(String(100), nullable=False)
     duration_minutes = Column(Integer, nullable=True)
     repetitions = Column(Integer, nullable=True)
-    intensity = Column(
-        Enum(ExerciseIntensity, native_enum=False, length=20),
-        nullable=False,
-        default=ExerciseIntensity.MEDIUM,
-    )
+    intensity = Column(String(20), nullable=False, default=ExerciseIntensity.MEDIUM.value)
     order_index = Column(Integer, nullable=False, default=0)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
 
@@ -40,6 +35,7 @@ class Exercise(Base):
     __table_args__ = (
         CheckConstraint("duration_minutes IS NULL OR duration_minutes > 0", name="check_duration_positive"),
         CheckConstraint("repetitions IS NULL OR repetitions > 0", name="check_repetitions_positive"),
+        CheckConstraint("intensity IN ('low', 'medium', 'high')", name="check_intensity_valid"),
     )
 
     # Relationships
@@ -1,10 +1,9 @@
 """Fitness plan model."""
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, TIMESTAMP, Text, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, Text, ForeignKey, Index, CheckConstraint, text
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 import enum
 
 
@@ -20,29 +19,33 @@ class FitnessPlan(Base):
 
     __tablename__ = "fitness_plan"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    user_id = Column(GUID(), ForeignKey("user.id"), nullable=False, index=True)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    user_id = Column(GUID(), ForeignKey("user.id"), nullable=False)
     name = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(
-        Enum(PlanStatus, native_enum=False, length=20),
-        nullable=False,
-        default=PlanStatus.ACTIVE,
-    )
+    status = Column(String(20), nullable=False, default=PlanStatus.ACTIVE.value)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
     updated_at = Column(
         TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
     deleted_at = Column(TIMESTAMP, nullable=True)
 
+    # Soft-deleted plans are never listed, so only live rows are indexed
+    __table_args__ = (
+        CheckConstraint("status IN ('active', 'paused')", name="check_status_valid"),
+        Index(
+            "ix_fitness_plan_user_id_active",
+            user_id,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="plans")
-    exercises = relationship(
-        "Exercise", back_populates="plan", cascade="all, delete-orphan", lazy="selectin"
-    )
-    reminders = relationship(
-        "Reminder", back_populates="plan", cascade="all, delete-orphan", lazy="selectin"
-    )
+    # Loaded per query with selectinload() where a response needs them
+    exercises = relationship("Exercise", back_populates="plan", cascade="all, delete-orphan")
+    reminders = relationship("Reminder", back_populates="plan", cascade="all, delete-orphan")
 
     def __repr__(self) -> str:
         return f"<FitnessPlan(id={self.id}, name={self.name}, status={self.status})>"
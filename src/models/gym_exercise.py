@@ -1,27 +1,39 @@
 """Database models for gym exercise tracking."""
-import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, Integer, Float, Text, Date, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Text, Date, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 
 
 class GymExerciseLog(Base):
     """Gym exercise log model for tracking strength training."""
     __tablename__ = "gym_exercise_log"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    user_id = Column(GUID(), ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
-    workout_date = Column(Date, nullable=False, index=True, default=date.today)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    user_id = Column(GUID(), ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    workout_date = Column(Date, nullable=False, default=date.today)
     exercise_name = Column(String(100), nullable=False)  # 器械名称或动作名称
     notes = Column(Text, nullable=True)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
     updated_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Composite indexes serving the per-user list and per-exercise trend queries,
+    # plus a BRIN index for date-range scans across users (PostgreSQL only)
+    __table_args__ = (
+        Index("ix_gym_exercise_log_user_date", user_id, workout_date.desc()),
+        Index("ix_gym_exercise_log_user_name_date", user_id, exercise_name, workout_date),
+        Index(
+            "ix_gym_exercise_log_date_brin",
+            workout_date,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="gym_exercise_logs")
-    sets = relationship("GymExerciseSet", back_populates="exercise", cascade="all, delete-orphan", order_by="GymExerciseSet.set_number")
+    sets = relationship("GymExerciseSet", back_populates="exercise", cascade="all, delete-orphan", order_by="GymExerciseSet.set_number", lazy="selectin", passive_deletes=True)
 
     def __repr__(self):
         return f"<GymExerciseLog {self.exercise_name} on {self.workout_date}>"
@@ -31,7 +43,7 @@ class GymExerciseSet(Base):
     """Gym exercise set model for tracking individual sets."""
     __tablename__ = "gym_exercise_set"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     gym_exercise_log_id = Column(GUID(), ForeignKey("gym_exercise_log.id", ondelete="CASCADE"), nullable=False, index=True)
     set_number = Column(Integer, nullable=False)  # 第几组 (1, 2, 3, ...)
     reps = Column(Integer, nullable=False)  # 次数
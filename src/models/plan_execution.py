@@ -1,10 +1,9 @@
 """Plan execution models for tracking workout completion."""
-import uuid
 from datetime import date, datetime
-from sqlalchemy import Column, String, Boolean, Integer, Date, TIMESTAMP, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, Integer, Date, TIMESTAMP, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 
 
 class PlanExecution(Base):
@@ -12,21 +11,38 @@ class PlanExecution(Base):
 
     __tablename__ = "plan_execution"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    plan_id = Column(GUID(), ForeignKey("fitness_plan.id"), nullable=False, index=True)
-    user_id = Column(GUID(), ForeignKey("user.id"), nullable=False, index=True)
-    execution_date = Column(Date, nullable=False, default=date.today, index=True)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    plan_id = Column(GUID(), ForeignKey("fitness_plan.id"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("user.id"), nullable=False)
+    execution_date = Column(Date, nullable=False, default=date.today)
     notes = Column(Text, nullable=True)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
     updated_at = Column(
         TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Composite indexes serving the per-user and per-plan newest-first list
+    # queries (the plan one also covers plan_id lookups), plus a BRIN index
+    # for date-range scans across users (PostgreSQL only)
+    __table_args__ = (
+        Index("ix_plan_execution_user_date", user_id, execution_date.desc()),
+        Index("ix_plan_execution_plan_date", plan_id, execution_date.desc()),
+        Index(
+            "ix_plan_execution_date_brin",
+            execution_date,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationships
     plan = relationship("FitnessPlan")
     user = relationship("User")
     exercise_executions = relationship(
-        "ExerciseExecution", back_populates="plan_execution", cascade="all, delete-orphan"
+        "ExerciseExecution",
+        back_populates="plan_execution",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -38,7 +54,7 @@ class ExerciseExecution(Base):
 
     __tablename__ = "exercise_execution"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     plan_execution_id = Column(
         GUID(), ForeignKey("plan_execution.id", ondelete="CASCADE"), nullable=False, index=True
     )
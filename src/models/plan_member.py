@@ -1,10 +1,9 @@
 """Plan member model for shared plans."""
-import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 
 
 class PlanMember(Base):
@@ -12,7 +11,7 @@ class PlanMember(Base):
 
     __tablename__ = "plan_member"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     plan_id = Column(GUID(), ForeignKey("fitness_plan.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(GUID(), ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
     invited_by = Column(GUID(), ForeignKey("user.id"), nullable=True)  # Who invited this user
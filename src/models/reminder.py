@@ -1,10 +1,9 @@
 """Reminder model (placeholder for Phase 4 - User Story 3)."""
-import uuid
 from datetime import datetime, time
-from sqlalchemy import Column, Boolean, Time, Enum, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Boolean, String, Time, TIMESTAMP, ForeignKey, CheckConstraint
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID, JSON
+from src.models.types import GUID, JSON, uuid7
 import enum
 
 
@@ -21,16 +20,12 @@ class Reminder(Base):
 
     __tablename__ = "reminder"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     plan_id = Column(
         GUID(), ForeignKey("fitness_plan.id"), nullable=False, index=True
     )
     reminder_time = Column(Time, nullable=False)
-    frequency = Column(
-        Enum(ReminderFrequency, native_enum=False, length=20),
-        nullable=False,
-        default=ReminderFrequency.WEEKLY,
-    )
+    frequency = Column(String(20), nullable=False, default=ReminderFrequency.WEEKLY.value)
     days_of_week = Column(JSON(), nullable=True)  # Array of integers [1-7]
     is_enabled = Column(Boolean, nullable=False, default=True)
     created_at = Column(TIMESTAMP, nullable=False, default=datetime.utcnow)
@@ -38,6 +33,11 @@ class Reminder(Base):
         TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Constraints
+    __table_args__ = (
+        CheckConstraint("frequency IN ('daily', 'weekly', 'custom')", name="check_frequency_valid"),
+    )
+
     # Relationships
     plan = relationship("FitnessPlan", back_populates="reminders")
 
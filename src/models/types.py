@@ -1,10 +1,30 @@
 """Custom SQLAlchemy types for cross-database compatibility."""
+import os
+import time
 import uuid
 from sqlalchemy import TypeDecorator, CHAR, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB as PG_JSONB
 import json
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right edge of the primary key index instead of on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 62 & 0xFFF) << 64  # rand_a
+        | 0b10 << 62  # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
 
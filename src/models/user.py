@@ -1,10 +1,9 @@
 """User model."""
-import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, TIMESTAMP
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 
 
 class User(Base):
@@ -12,7 +11,7 @@ class User(Base):
 
     __tablename__ = "user"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid7)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(100), nullable=True)
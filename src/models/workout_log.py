@@ -1,10 +1,9 @@
 """Workout log model for tracking free-form exercise sessions."""
-import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, Integer, Float, Date, TIMESTAMP, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Float, Date, TIMESTAMP, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-from src.models.types import GUID
+from src.models.types import GUID, uuid7
 
 
 class WorkoutLog(Base):
@@ -12,11 +11,9 @@ class WorkoutLog(Base):
 
     __tablename__ = "workout_log"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
-        GUID(), ForeignKey("user.id"), nullable=False, index=True
-    )
-    workout_date = Column(Date, nullable=False, index=True, default=date.today)
+    id = Column(GUID(), primary_key=True, default=uuid7)
+    user_id = Column(GUID(), ForeignKey("user.id"), nullable=False)
+    workout_date = Column(Date, nullable=False, default=date.today)
     workout_name = Column(String(100), nullable=False)
     duration_minutes = Column(Integer, nullable=False)  # Duration in minutes
     calories_burned = Column(Float, nullable=True)  # Calories burned (optional)
@@ -26,6 +23,18 @@ class WorkoutLog(Base):
         TIMESTAMP, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    # Composite index serving the per-user, newest-first list queries, plus a
+    # BRIN index for date-range scans across users (PostgreSQL only)
+    __table_args__ = (
+        Index("ix_workout_log_user_date", user_id, workout_date.desc()),
+        Index(
+            "ix_workout_log_date_brin",
+            workout_date,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="workout_logs")
 
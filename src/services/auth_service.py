@@ -1,8 +1,11 @@
 """Service layer for authentication."""
+import asyncio
+from functools import lru_cache
 from typing import Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from datetime import timedelta
 
 from src.models.user import User
@@ -12,6 +15,21 @@ from src.core.config import settings
 from src.api.middleware.error_handler import BusinessRuleViolationException
 
 
+@lru_cache(maxsize=1)
+def dummy_password_hash() -> str:
+    """Hash checked when no user matches, built once with the configured cost.
+
+    Called at startup so the first unknown-email login does not also pay
+    for building it.
+    """
+    return hash_password("!invalid!")
+
+
+def _verify_dummy_password(password: str) -> None:
+    """Spend one bcrypt check so unknown emails take as long as wrong passwords."""
+    verify_password(password, dummy_password_hash())
+
+
 class AuthService:
     """Service for user authentication."""
 
@@ -30,7 +48,7 @@ class AuthService:
         Raises:
             BusinessRuleViolationException: If email already exists
         """
-        # Check if email already exists
+        # Check if email already exists before spending a bcrypt hash on it
         result = await self.db.execute(
             select(User).where(User.email == user_data.email)
         )
@@ -41,8 +59,9 @@ class AuthService:
                 "Email address already registered"
             )
 
-        # Hash password
-        password_hash = hash_password(user_data.password)
+        # Hash password in a worker thread; bcrypt releases the GIL, so the
+        # event loop keeps serving other requests meanwhile
+        password_hash = await asyncio.to_thread(hash_password, user_data.password)
 
         # Create user
         user = User(
@@ -52,8 +71,14 @@ class AuthService:
         )
 
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # A concurrent registration took the email after the check above
+            await self.db.rollback()
+            raise BusinessRuleViolationException(
+                "Email address already registered"
+            )
 
         return user
 
@@ -76,12 +101,15 @@ class AuthService:
         user = result.scalar_one_or_none()
 
         if not user:
+            await asyncio.to_thread(_verify_dummy_password, login_data.password)
             raise BusinessRuleViolationException(
                 "Invalid email or password"
             )
 
-        # Verify password
-        if not verify_password(login_data.password, user.password_hash):
+        # Verify password off the event loop (see register_user)
+        if not await asyncio.to_thread(
+            verify_password, login_data.password, user.password_hash
+        ):
             raise BusinessRuleViolationException(
                 "Invalid email or password"
             )
@@ -2,8 +2,8 @@
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import ColumnElement, select, and_, exists, update, delete
+from sqlalchemy.orm import aliased, selectinload
 
 from src.models.exercise import Exercise
 from src.models.fitness_plan import FitnessPlan
@@ -11,6 +11,23 @@ from src.api.schemas.plan_schemas import ExerciseCreate, ExerciseUpdate
 from src.api.middleware.error_handler import NotFoundException, BusinessRuleViolationException
 
 
+def _owned_exercise(user_id: UUID, plan_id: UUID, exercise_id: UUID) -> ColumnElement[bool]:
+    """Filter matching an exercise only if its plan is live and owned by user_id.
+
+    Written as EXISTS rather than a join so it also works as the WHERE
+    clause of an UPDATE or DELETE on exercise.
+    """
+    return and_(
+        Exercise.id == exercise_id,
+        Exercise.plan_id == plan_id,
+        exists().where(
+            FitnessPlan.id == Exercise.plan_id,
+            FitnessPlan.user_id == user_id,
+            FitnessPlan.deleted_at.is_(None),
+        ),
+    )
+
+
 class ExerciseService:
     """Service for managing exercises within fitness plans."""
 
@@ -58,9 +75,10 @@ class ExerciseService:
             order_index=exercise_data.order_index,
         )
 
+        # Every column has a client value or Python-side default, so the
+        # instance is complete after the commit and needs no refresh
         self.db.add(exercise)
         await self.db.commit()
-        await self.db.refresh(exercise)
 
         return exercise
 
@@ -81,31 +99,24 @@ class ExerciseService:
         Raises:
             NotFoundException: If exercise not found or user doesn't own the plan
         """
-        # Fetch exercise with plan ownership verification
+        update_data = exercise_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_exercise_by_id(user_id, plan_id, exercise_id)
+
+        # Verify ownership and update in one statement
         result = await self.db.execute(
-            select(Exercise)
-            .join(FitnessPlan, Exercise.plan_id == FitnessPlan.id)
-            .where(
-                and_(
-                    Exercise.id == exercise_id,
-                    Exercise.plan_id == plan_id,
-                    FitnessPlan.user_id == user_id,
-                    FitnessPlan.deleted_at.is_(None),
-                )
-            )
+            update(Exercise)
+            .where(_owned_exercise(user_id, plan_id, exercise_id))
+            .values(**update_data)
+            .returning(Exercise)
+            .execution_options(populate_existing=True)
         )
         exercise = result.scalar_one_or_none()
 
         if exercise is None:
             raise NotFoundException("Exercise not found")
 
-        # Update fields
-        update_data = exercise_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(exercise, field, value)
-
         await self.db.commit()
-        await self.db.refresh(exercise)
 
         return exercise
 
@@ -123,37 +134,26 @@ class ExerciseService:
             NotFoundException: If exercise not found or user doesn't own the plan
             BusinessRuleViolationException: If trying to delete the last exercise
         """
-        # Fetch exercise with plan ownership verification
+        # Verify ownership, keep at least one exercise in the plan and delete
+        # in one statement
+        sibling = aliased(Exercise)
         result = await self.db.execute(
-            select(Exercise)
-            .join(FitnessPlan, Exercise.plan_id == FitnessPlan.id)
+            delete(Exercise)
             .where(
-                and_(
-                    Exercise.id == exercise_id,
-                    Exercise.plan_id == plan_id,
-                    FitnessPlan.user_id == user_id,
-                    FitnessPlan.deleted_at.is_(None),
-                )
+                _owned_exercise(user_id, plan_id, exercise_id),
+                exists().where(sibling.plan_id == plan_id, sibling.id != exercise_id),
             )
+            .returning(Exercise.id)
         )
-        exercise = result.scalar_one_or_none()
-
-        if exercise is None:
-            raise NotFoundException("Exercise not found")
-
-        # Check if this is the last exercise in the plan
-        count_result = await self.db.execute(
-            select(func.count()).select_from(Exercise).where(Exercise.plan_id == plan_id)
-        )
-        exercise_count = count_result.scalar()
 
-        if exercise_count <= 1:
+        if result.scalar_one_or_none() is None:
+            # Nothing deleted: raises NotFoundException unless the exercise
+            # exists, in which case it was the last one
+            await self.get_exercise_by_id(user_id, plan_id, exercise_id)
             raise BusinessRuleViolationException(
                 "Cannot delete the last exercise from a plan. A plan must have at least one exercise."
             )
 
-        # Delete exercise
-        await self.db.delete(exercise)
         await self.db.commit()
 
     async def get_exercise_by_id(
@@ -1,17 +1,20 @@
 """Service for managing gym exercise logs."""
 from typing import Tuple, Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, func, insert, delete
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from src.models.gym_exercise import GymExerciseLog, GymExerciseSet
 from src.api.schemas.gym_exercise_schemas import (
     GymExerciseLogCreate,
     GymExerciseLogUpdate,
     GymExerciseLogSummary,
+    GymExerciseSetCreate,
 )
-from src.api.middleware.error_handler import NotFoundException
+from src.api.middleware.error_handler import AppException, NotFoundException
+from src.core.pagination import apply_keyset_page, split_keyset_page
 
 
 class GymExerciseService:
@@ -48,30 +51,43 @@ class GymExerciseService:
         self.db.add(exercise_log)
         await self.db.flush()  # Flush to get the ID
 
-        # Create sets
-        for set_data in exercise_data.sets:
-            exercise_set = GymExerciseSet(
-                gym_exercise_log_id=exercise_log.id,
-                set_number=set_data.set_number,
-                reps=set_data.reps,
-                weight=set_data.weight,
-                notes=set_data.notes,
-            )
-            self.db.add(exercise_set)
+        new_sets = await self._insert_sets(exercise_log.id, exercise_data.sets)
+        set_committed_value(exercise_log, "sets", new_sets)
 
         await self.db.commit()
-        await self.db.refresh(exercise_log)
-
-        # Load sets relationship
-        result = await self.db.execute(
-            select(GymExerciseLog)
-            .where(GymExerciseLog.id == exercise_log.id)
-            .options(selectinload(GymExerciseLog.sets))
-        )
-        exercise_log = result.scalar_one()
 
         return exercise_log
 
+    async def _insert_sets(
+        self, exercise_log_id: UUID, sets: list[GymExerciseSetCreate]
+    ) -> list[GymExerciseSet]:
+        """Insert all sets of an exercise log in a single batched INSERT.
+
+        Args:
+            exercise_log_id: Gym exercise log ID
+            sets: Set data from the create/update request
+
+        Returns:
+            Inserted sets ordered by set number, as the relationship loads them
+        """
+        if not sets:
+            return []
+
+        result = await self.db.scalars(
+            insert(GymExerciseSet).returning(GymExerciseSet, sort_by_parameter_order=True),
+            [
+                {
+                    "gym_exercise_log_id": exercise_log_id,
+                    "set_number": set_data.set_number,
+                    "reps": set_data.reps,
+                    "weight": set_data.weight,
+                    "notes": set_data.notes,
+                }
+                for set_data in sets
+            ],
+        )
+        return sorted(result.all(), key=lambda exercise_set: exercise_set.set_number)
+
     async def get_gym_exercise_logs(
         self,
         user_id: UUID,
@@ -79,66 +95,94 @@ class GymExerciseService:
         end_date: Optional[date] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> Tuple[list[GymExerciseLogSummary], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[list[GymExerciseLogSummary], Optional[int], Optional[str]]:
         """Get paginated gym exercise logs for a user with summary data.
 
+        Pages are addressed either by ``page`` (OFFSET) or, when ``cursor`` is
+        given, by seeking past the last row of the previous page.
+
         Args:
             user_id: User ID
             start_date: Optional start date filter
             end_date: Optional end date filter
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when cursor is given
             page_size: Items per page
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to run the COUNT query for the total
 
         Returns:
-            Tuple of (gym exercise logs list with summary, total count)
-        """
-        # Build query with filters
-        query = (
-            select(GymExerciseLog)
-            .where(GymExerciseLog.user_id == user_id)
-            .options(selectinload(GymExerciseLog.sets))
-        )
+            Tuple of (gym exercise logs list with summary, total count or None,
+            next page cursor or None)
 
+        Raises:
+            AppException: If the cursor is malformed
+        """
+        filters = [GymExerciseLog.user_id == user_id]
         if start_date:
-            query = query.where(GymExerciseLog.workout_date >= start_date)
+            filters.append(GymExerciseLog.workout_date >= start_date)
         if end_date:
-            query = query.where(GymExerciseLog.workout_date <= end_date)
-
-        # Order by date descending (most recent first)
-        query = query.order_by(desc(GymExerciseLog.workout_date), desc(GymExerciseLog.created_at))
+            filters.append(GymExerciseLog.workout_date <= end_date)
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar() or 0
+        total_count = None
+        if include_total:
+            count_result = await self.db.execute(
+                select(func.count()).select_from(GymExerciseLog).where(*filters)
+            )
+            total_count = count_result.scalar() or 0
+
+        # Per-log set totals are aggregated in SQL rather than loading every set
+        query = (
+            select(
+                GymExerciseLog,
+                func.count(GymExerciseSet.id),
+                func.coalesce(func.sum(GymExerciseSet.reps), 0),
+                func.coalesce(
+                    func.sum(GymExerciseSet.reps * func.coalesce(GymExerciseSet.weight, 0)), 0
+                ),
+            )
+            .outerjoin(GymExerciseSet, GymExerciseSet.gym_exercise_log_id == GymExerciseLog.id)
+            .where(*filters)
+            .group_by(GymExerciseLog.id)
+            .options(raiseload(GymExerciseLog.sets))
+        )
 
-        # Apply pagination
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        # Order by date descending (most recent first), then apply pagination
+        sort_key = (GymExerciseLog.workout_date, GymExerciseLog.created_at, GymExerciseLog.id)
+        try:
+            query = apply_keyset_page(
+                query,
+                sort_key,
+                (date.fromisoformat, datetime.fromisoformat, UUID),
+                page,
+                page_size,
+                cursor,
+            )
+        except ValueError:
+            raise AppException("Invalid pagination cursor", "INVALID_CURSOR")
 
         # Execute query
         result = await self.db.execute(query)
-        exercise_logs = list(result.scalars().all())
-
-        # Create summary objects
-        summaries = []
-        for log in exercise_logs:
-            total_sets = len(log.sets)
-            total_reps = sum(s.reps for s in log.sets)
-            total_volume = sum(s.reps * (s.weight or 0) for s in log.sets)
-
-            summaries.append(
-                GymExerciseLogSummary(
-                    id=log.id,
-                    workout_date=log.workout_date,
-                    exercise_name=log.exercise_name,
-                    total_sets=total_sets,
-                    total_reps=total_reps,
-                    total_volume=total_volume,
-                    created_at=log.created_at,
-                )
+        rows, next_cursor = split_keyset_page(
+            [tuple(row) for row in result.all()], sort_key, page_size
+        )
+
+        summaries = [
+            GymExerciseLogSummary.model_construct(
+                id=log.id,
+                workout_date=log.workout_date,
+                exercise_name=log.exercise_name,
+                total_sets=total_sets,
+                total_reps=total_reps,
+                total_volume=total_volume,
+                created_at=log.created_at,
             )
+            for log, total_sets, total_reps, total_volume in rows
+        ]
 
-        return summaries, total_count
+        return summaries, total_count, next_cursor
 
     async def get_gym_exercise_log_by_id(
         self, user_id: UUID, exercise_log_id: UUID
@@ -198,34 +242,17 @@ class GymExerciseService:
         if exercise_data.notes is not None:
             exercise_log.notes = exercise_data.notes
 
-        # Update sets if provided
+        # Replace sets if provided
         if exercise_data.sets is not None:
-            # Delete existing sets
-            for existing_set in exercise_log.sets:
-                await self.db.delete(existing_set)
-            await self.db.flush()
-
-            # Create new sets
-            for set_data in exercise_data.sets:
-                exercise_set = GymExerciseSet(
-                    gym_exercise_log_id=exercise_log.id,
-                    set_number=set_data.set_number,
-                    reps=set_data.reps,
-                    weight=set_data.weight,
-                    notes=set_data.notes,
+            await self.db.execute(
+                delete(GymExerciseSet).where(
+                    GymExerciseSet.gym_exercise_log_id == exercise_log.id
                 )
-                self.db.add(exercise_set)
+            )
+            new_sets = await self._insert_sets(exercise_log.id, exercise_data.sets)
+            set_committed_value(exercise_log, "sets", new_sets)
 
         await self.db.commit()
-        await self.db.refresh(exercise_log)
-
-        # Load sets relationship
-        result = await self.db.execute(
-            select(GymExerciseLog)
-            .where(GymExerciseLog.id == exercise_log.id)
-            .options(selectinload(GymExerciseLog.sets))
-        )
-        exercise_log = result.scalar_one()
 
         return exercise_log
 
@@ -241,10 +268,50 @@ class GymExerciseService:
         Raises:
             NotFoundException: If gym exercise log not found or not owned by user
         """
-        exercise_log = await self.get_gym_exercise_log_by_id(user_id, exercise_log_id)
+        deleted = await self._delete_owned_logs(user_id, [exercise_log_id])
+        if deleted == 0:
+            raise NotFoundException("Gym exercise log not found")
+
+        await self.db.commit()
+
+    async def delete_gym_exercise_logs(self, user_id: UUID, exercise_log_ids: list[UUID]) -> int:
+        """Delete several gym exercise logs at once.
+
+        IDs that do not exist or belong to another user are skipped.
+
+        Args:
+            user_id: User ID (for ownership verification)
+            exercise_log_ids: Gym exercise log IDs
 
-        await self.db.delete(exercise_log)
+        Returns:
+            Number of logs deleted
+        """
+        deleted = await self._delete_owned_logs(user_id, exercise_log_ids)
         await self.db.commit()
+        return deleted
+
+    async def _delete_owned_logs(self, user_id: UUID, exercise_log_ids: list[UUID]) -> int:
+        """Delete the user's logs among the given IDs, together with their sets.
+
+        Sets are deleted with one statement instead of being loaded and deleted
+        row by row through the ORM cascade.
+
+        Args:
+            user_id: User ID (for ownership verification)
+            exercise_log_ids: Gym exercise log IDs
+
+        Returns:
+            Number of logs deleted
+        """
+        owned = and_(GymExerciseLog.id.in_(exercise_log_ids), GymExerciseLog.user_id == user_id)
+
+        await self.db.execute(
+            delete(GymExerciseSet).where(
+                GymExerciseSet.gym_exercise_log_id.in_(select(GymExerciseLog.id).where(owned))
+            )
+        )
+        result = await self.db.execute(delete(GymExerciseLog).where(owned))
+        return result.rowcount
 
     async def get_exercise_names(self, user_id: UUID) -> list[str]:
         """Get list of all unique exercise names for a user.
@@ -255,11 +322,24 @@ class GymExerciseService:
         Returns:
             List of unique exercise names sorted alphabetically
         """
+        # Loose index scan: rather than reading every log of the user for a
+        # DISTINCT, hop from one name to the next smallest name through the
+        # (user_id, exercise_name, workout_date) index, one probe per name
+        names = select(
+            func.min(GymExerciseLog.exercise_name).label("name")
+        ).where(GymExerciseLog.user_id == user_id).cte("names", recursive=True)
+        next_name = (
+            select(func.min(GymExerciseLog.exercise_name))
+            .where(
+                GymExerciseLog.user_id == user_id,
+                GymExerciseLog.exercise_name > names.c.name,
+            )
+            .scalar_subquery()
+        )
+        names = names.union_all(select(next_name).where(names.c.name.is_not(None)))
+
         result = await self.db.execute(
-            select(GymExerciseLog.exercise_name)
-            .where(GymExerciseLog.user_id == user_id)
-            .distinct()
-            .order_by(GymExerciseLog.exercise_name)
+            select(names.c.name).where(names.c.name.is_not(None)).order_by(names.c.name)
         )
         exercise_names = [name for name in result.scalars().all()]
 
@@ -275,44 +355,35 @@ class GymExerciseService:
         Returns:
             Dictionary containing trend data with dates and metrics
         """
-        # Query all logs for this exercise
+        # Aggregate each session's sets in the database; sessions without
+        # sets drop out of the inner join
         result = await self.db.execute(
-            select(GymExerciseLog)
+            select(
+                GymExerciseLog.workout_date,
+                func.max(GymExerciseSet.weight),
+                func.avg(GymExerciseSet.weight),
+                func.sum(GymExerciseSet.reps),
+            )
+            .join(GymExerciseSet, GymExerciseSet.gym_exercise_log_id == GymExerciseLog.id)
             .where(
                 and_(
                     GymExerciseLog.user_id == user_id,
                     GymExerciseLog.exercise_name == exercise_name,
                 )
             )
-            .options(selectinload(GymExerciseLog.sets))
-            .order_by(GymExerciseLog.workout_date)
+            .group_by(GymExerciseLog.id, GymExerciseLog.workout_date, GymExerciseLog.created_at)
+            .order_by(GymExerciseLog.workout_date, GymExerciseLog.created_at)
         )
-        exercise_logs = list(result.scalars().all())
 
-        # Process data for each workout date
         dates = []
         max_weights = []
         avg_weights = []
         total_reps_list = []
 
-        for log in exercise_logs:
-            if not log.sets:
-                continue
-
-            date_str = log.workout_date.isoformat()
-            dates.append(date_str)
-
-            # Calculate max weight for this session
-            weights = [s.weight for s in log.sets if s.weight is not None]
-            max_weight = max(weights) if weights else 0
-            max_weights.append(max_weight)
-
-            # Calculate average weight for this session
-            avg_weight = sum(weights) / len(weights) if weights else 0
-            avg_weights.append(round(avg_weight, 1))
-
-            # Calculate total reps for this session
-            total_reps = sum(s.reps for s in log.sets)
+        for workout_date, max_weight, avg_weight, total_reps in result.all():
+            dates.append(workout_date.isoformat())
+            max_weights.append(max_weight or 0)
+            avg_weights.append(round(avg_weight, 1) if avg_weight is not None else 0)
             total_reps_list.append(total_reps)
 
         return {
@@ -1,10 +1,22 @@
 """Service for sending push notifications."""
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
 from uuid import UUID
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on push notifications in flight at once during a bulk send
+BULK_SEND_CONCURRENCY = 64
+
+_INTENSITY_LABELS = {"low": "低强度", "medium": "中强度", "high": "高强度"}
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with second precision, e.g. 2025-11-10T07:00:00Z."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
 
 class NotificationService:
     """Service for sending push notifications to users."""
@@ -15,6 +27,7 @@ class NotificationService:
         plan_id: UUID,
         plan_name: str,
         exercises: List[Any],
+        timestamp: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Send a push notification for a fitness plan reminder.
 
@@ -23,6 +36,7 @@ class NotificationService:
             plan_id: Plan ID
             plan_name: Name of the fitness plan
             exercises: List of exercises in the plan
+            timestamp: ISO 8601 send time; taken from the clock when omitted
 
         Returns:
             Dictionary with notification status
@@ -45,7 +59,7 @@ class NotificationService:
             "user_id": str(user_id),
             "plan_id": str(plan_id),
             "message": message,
-            "timestamp": "2025-11-10T07:00:00Z",  # In production, use actual timestamp
+            "timestamp": timestamp or _utc_timestamp(),
         }
 
         return notification_result
@@ -60,15 +74,11 @@ class NotificationService:
         Returns:
             Formatted notification message
         """
-        # Create exercise summary
-        exercise_summary = self._create_exercise_summary(exercises)
-
-        # Format message
-        message = f"🏃 健身提醒：{plan_name}\n\n"
-        message += f"今天的锻炼计划：\n{exercise_summary}\n\n"
-        message += "加油！坚持锻炼，保持健康！💪"
-
-        return message
+        return (
+            f"🏃 健身提醒：{plan_name}\n\n"
+            f"今天的锻炼计划：\n{self._create_exercise_summary(exercises)}\n\n"
+            "加油！坚持锻炼，保持健康！💪"
+        )
 
     def _create_exercise_summary(self, exercises: List[Any]) -> str:
         """Create a summary of exercises.
@@ -82,43 +92,43 @@ class NotificationService:
         if not exercises:
             return "暂无锻炼项目"
 
-        summary_lines = []
-        for idx, exercise in enumerate(exercises, 1):
-            exercise_name = exercise.name
+        return "\n".join(
+            self._format_exercise_line(idx, exercise)
+            for idx, exercise in enumerate(exercises, 1)
+        )
 
-            # Format duration or repetitions
-            if exercise.duration_minutes:
-                detail = f"{exercise.duration_minutes}分钟"
-            elif exercise.repetitions:
-                detail = f"{exercise.repetitions}次"
-            else:
-                detail = ""
+    @staticmethod
+    def _format_exercise_line(idx: int, exercise: Any) -> str:
+        """Format one numbered line of the exercise summary.
 
-            # Format intensity
-            intensity_map = {"low": "低强度", "medium": "中强度", "high": "高强度"}
-            intensity = intensity_map.get(
-                exercise.intensity.value if hasattr(exercise.intensity, "value") else exercise.intensity,
-                "",
-            )
+        Args:
+            idx: 1-based position of the exercise in the plan
+            exercise: Exercise object
 
-            # Combine details
-            exercise_line = f"{idx}. {exercise_name}"
-            if detail:
-                exercise_line += f" - {detail}"
-            if intensity:
-                exercise_line += f" ({intensity})"
+        Returns:
+            Line such as "1. 跑步 - 30分钟 (中强度)"
+        """
+        # Format duration or repetitions
+        if exercise.duration_minutes:
+            detail = f" - {exercise.duration_minutes}分钟"
+        elif exercise.repetitions:
+            detail = f" - {exercise.repetitions}次"
+        else:
+            detail = ""
 
-            summary_lines.append(exercise_line)
+        # Intensity is stored as its string value; enum members are accepted too
+        intensity = _INTENSITY_LABELS.get(getattr(exercise.intensity, "value", exercise.intensity))
+        intensity = f" ({intensity})" if intensity else ""
 
-        return "\n".join(summary_lines)
+        return f"{idx}. {exercise.name}{detail}{intensity}"
 
     async def send_bulk_notifications(
         self, notifications: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Send multiple notifications in bulk.
 
-        This method can be used for batch sending, which is more efficient
-        when multiple notifications need to be sent at once.
+        Notifications are sent concurrently, at most BULK_SEND_CONCURRENCY
+        at a time.
 
         Args:
             notifications: List of notification data dictionaries
@@ -126,20 +136,40 @@ class NotificationService:
         Returns:
             Dictionary with bulk send status
         """
+        semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+        # One send time for the whole batch instead of a clock read per notification
+        timestamp = _utc_timestamp()
+
+        async def send_one(notification_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.send_push_notification(
+                    user_id=notification_data["user_id"],
+                    plan_id=notification_data["plan_id"],
+                    plan_name=notification_data["plan_name"],
+                    exercises=notification_data["exercises"],
+                    timestamp=timestamp,
+                )
+
+        # The sends are independent I/O, so overlap them instead of awaiting
+        # each in turn; one failure doesn't stop the rest of the batch
+        outcomes = await asyncio.gather(
+            *(send_one(notification_data) for notification_data in notifications),
+            return_exceptions=True,
+        )
+
         results = []
-        for notification_data in notifications:
-            result = await self.send_push_notification(
-                user_id=notification_data["user_id"],
-                plan_id=notification_data["plan_id"],
-                plan_name=notification_data["plan_name"],
-                exercises=notification_data["exercises"],
-            )
-            results.append(result)
+        for notification_data, outcome in zip(notifications, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"Failed to send notification to user {notification_data['user_id']}: {outcome}"
+                )
+            else:
+                results.append(outcome)
 
         return {
             "status": "completed",
             "total": len(notifications),
             "successful": len(results),
-            "failed": 0,
+            "failed": len(notifications) - len(results),
             "results": results,
         }
@@ -1,18 +1,23 @@
 """Service for managing plan executions."""
 from typing import Tuple, Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, or_, func, insert, delete, literal
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from src.models.plan_execution import PlanExecution, ExerciseExecution
 from src.models.fitness_plan import FitnessPlan
+from src.models.plan_member import PlanMember
+from src.models.types import uuid7
 from src.api.schemas.plan_execution_schemas import (
+    ExerciseExecutionCreate,
     PlanExecutionCreate,
     PlanExecutionUpdate,
     PlanExecutionSummary,
 )
-from src.api.middleware.error_handler import NotFoundException
+from src.api.middleware.error_handler import AppException, NotFoundException
+from src.core.pagination import apply_keyset_page, split_keyset_page
 
 
 class PlanExecutionService:
@@ -41,63 +46,79 @@ class PlanExecutionService:
         Raises:
             NotFoundException: If plan not found or user doesn't have access
         """
-        from src.models.plan_member import PlanMember
-        from sqlalchemy import or_
-
-        # Verify plan exists and user has access (owner or member)
-        result = await self.db.execute(
-            select(FitnessPlan).where(
-                and_(
-                    FitnessPlan.id == execution_data.plan_id,
-                    or_(
-                        FitnessPlan.user_id == user_id,  # User is owner
-                        FitnessPlan.id.in_(  # User is member
-                            select(PlanMember.plan_id).where(PlanMember.user_id == user_id)
-                        )
-                    ),
-                )
+        # Create the plan execution with INSERT ... SELECT from the plan row,
+        # which only yields a row if the plan exists and the user has access
+        # (owner or member). The ID is generated here so no flush is needed to
+        # get it, and RETURNING hands back the parent and, below, the exercise
+        # executions as ORM objects so nothing is reloaded
+        execution_id = uuid7()
+        accessible_plan = select(
+            literal(execution_id, PlanExecution.id.type),
+            literal(user_id, PlanExecution.user_id.type),
+            FitnessPlan.id,
+            literal(execution_data.execution_date, PlanExecution.execution_date.type),
+            literal(execution_data.notes, PlanExecution.notes.type),
+        ).where(
+            and_(
+                FitnessPlan.id == execution_data.plan_id,
+                or_(
+                    FitnessPlan.user_id == user_id,  # User is owner
+                    FitnessPlan.id.in_(  # User is member
+                        select(PlanMember.plan_id).where(PlanMember.user_id == user_id)
+                    )
+                ),
             )
         )
-        plan = result.scalar_one_or_none()
-        if plan is None:
+        plan_execution = await self.db.scalar(
+            insert(PlanExecution)
+            .from_select(
+                ["id", "user_id", "plan_id", "execution_date", "notes"], accessible_plan
+            )
+            .returning(PlanExecution)
+        )
+        if plan_execution is None:
             raise NotFoundException("Fitness plan not found")
 
-        # Create plan execution
-        plan_execution = PlanExecution(
-            user_id=user_id,
-            plan_id=execution_data.plan_id,
-            execution_date=execution_data.execution_date,
-            notes=execution_data.notes,
+        exercise_executions = await self._insert_exercise_executions(
+            execution_id, execution_data.exercise_executions
         )
-
-        self.db.add(plan_execution)
-        await self.db.flush()  # Flush to get the ID
-
-        # Create exercise executions
-        for exercise_exec_data in execution_data.exercise_executions:
-            exercise_execution = ExerciseExecution(
-                plan_execution_id=plan_execution.id,
-                exercise_id=exercise_exec_data.exercise_id,
-                completed=exercise_exec_data.completed,
-                actual_duration_minutes=exercise_exec_data.actual_duration_minutes,
-                actual_repetitions=exercise_exec_data.actual_repetitions,
-                notes=exercise_exec_data.notes,
-            )
-            self.db.add(exercise_execution)
+        set_committed_value(plan_execution, "exercise_executions", exercise_executions)
 
         await self.db.commit()
-        await self.db.refresh(plan_execution)
-
-        # Load relationships
-        result = await self.db.execute(
-            select(PlanExecution)
-            .where(PlanExecution.id == plan_execution.id)
-            .options(selectinload(PlanExecution.exercise_executions))
-        )
-        plan_execution = result.scalar_one()
 
         return plan_execution
 
+    async def _insert_exercise_executions(
+        self, execution_id: UUID, exercise_executions: list[ExerciseExecutionCreate]
+    ) -> list[ExerciseExecution]:
+        """Insert all exercise executions of a plan execution in a single batched INSERT.
+
+        Args:
+            execution_id: Plan execution ID
+            exercise_executions: Exercise execution data from the create/update request
+
+        Returns:
+            Inserted exercise executions in request order
+        """
+        if not exercise_executions:
+            return []
+
+        result = await self.db.scalars(
+            insert(ExerciseExecution).returning(ExerciseExecution, sort_by_parameter_order=True),
+            [
+                {
+                    "plan_execution_id": execution_id,
+                    "exercise_id": exercise_exec_data.exercise_id,
+                    "completed": exercise_exec_data.completed,
+                    "actual_duration_minutes": exercise_exec_data.actual_duration_minutes,
+                    "actual_repetitions": exercise_exec_data.actual_repetitions,
+                    "notes": exercise_exec_data.notes,
+                }
+                for exercise_exec_data in exercise_executions
+            ],
+        )
+        return list(result.all())
+
     async def get_plan_executions(
         self,
         user_id: UUID,
@@ -106,7 +127,9 @@ class PlanExecutionService:
         end_date: Optional[date] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> Tuple[list[PlanExecutionSummary], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[list[PlanExecutionSummary], Optional[int], Optional[str]]:
         """Get paginated plan executions for a user with summary data.
 
         Args:
@@ -114,99 +137,124 @@ class PlanExecutionService:
             plan_id: Optional plan ID filter
             start_date: Optional start date filter
             end_date: Optional end date filter
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when cursor is given
             page_size: Items per page
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to run the COUNT query for the total
 
         Returns:
-            Tuple of (plan execution summaries list, total count)
-        """
-        # Build query with filters
-        query = (
-            select(PlanExecution)
-            .where(PlanExecution.user_id == user_id)
-            .options(
-                selectinload(PlanExecution.exercise_executions),
-                selectinload(PlanExecution.plan),
-            )
-        )
+            Tuple of (plan execution summaries list, total count or None,
+            next page cursor or None)
 
+        Raises:
+            AppException: If the cursor is malformed
+        """
+        filters = [PlanExecution.user_id == user_id]
         if plan_id:
-            query = query.where(PlanExecution.plan_id == plan_id)
+            filters.append(PlanExecution.plan_id == plan_id)
         if start_date:
-            query = query.where(PlanExecution.execution_date >= start_date)
+            filters.append(PlanExecution.execution_date >= start_date)
         if end_date:
-            query = query.where(PlanExecution.execution_date <= end_date)
-
-        # Order by date descending (most recent first)
-        query = query.order_by(desc(PlanExecution.execution_date), desc(PlanExecution.created_at))
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar() or 0
+            filters.append(PlanExecution.execution_date <= end_date)
 
-        # Apply pagination
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        # Get total count straight from the table, without the loader options
+        total_count = None
+        if include_total:
+            count_result = await self.db.execute(
+                select(func.count()).select_from(PlanExecution).where(*filters)
+            )
+            total_count = count_result.scalar() or 0
+
+        # Order by date descending (most recent first), then apply pagination
+        sort_key = (PlanExecution.execution_date, PlanExecution.created_at, PlanExecution.id)
+        try:
+            query = apply_keyset_page(
+                select(PlanExecution)
+                .where(*filters)
+                .options(
+                    selectinload(PlanExecution.exercise_executions),
+                    selectinload(PlanExecution.plan).selectinload(FitnessPlan.exercises),
+                    raiseload("*"),
+                ),
+                sort_key,
+                (date.fromisoformat, datetime.fromisoformat, UUID),
+                page,
+                page_size,
+                cursor,
+            )
+        except ValueError:
+            raise AppException("Invalid pagination cursor", "INVALID_CURSOR")
 
         # Execute query
         result = await self.db.execute(query)
-        plan_executions = list(result.scalars().all())
+        plan_executions, next_cursor = split_keyset_page(
+            list(result.scalars().all()), sort_key, page_size
+        )
 
         # Create summary objects
-        summaries = []
-        for execution in plan_executions:
-            total_exercises = len(execution.exercise_executions)
-
-            # Calculate completion rate for each exercise based on actual vs planned
-            exercise_completion_rates = []
-            completed_count = 0
-
-            for ex_exec in execution.exercise_executions:
-                if not ex_exec.completed:
-                    # Not completed at all = 0%
-                    exercise_completion_rates.append(0)
-                else:
-                    completed_count += 1
-                    # Find the corresponding exercise from the plan
-                    exercise = next((e for e in execution.plan.exercises if e.id == ex_exec.exercise_id), None)
-
-                    if exercise:
-                        # Calculate based on actual vs planned
-                        if exercise.duration_minutes and ex_exec.actual_duration_minutes:
-                            # For duration-based exercises
-                            rate = min((ex_exec.actual_duration_minutes / exercise.duration_minutes) * 100, 100)
-                            exercise_completion_rates.append(rate)
-                        elif exercise.repetitions and ex_exec.actual_repetitions:
-                            # For repetition-based exercises
-                            rate = min((ex_exec.actual_repetitions / exercise.repetitions) * 100, 100)
-                            exercise_completion_rates.append(rate)
-                        else:
-                            # Completed but no actual data provided = 100%
-                            exercise_completion_rates.append(100)
+        summaries = [self._summarize_execution(execution) for execution in plan_executions]
+
+        return summaries, total_count, next_cursor
+
+    @staticmethod
+    def _summarize_execution(execution: PlanExecution) -> PlanExecutionSummary:
+        """Build the list summary of one plan execution.
+
+        Args:
+            execution: Plan execution with exercise executions and plan exercises loaded
+
+        Returns:
+            Summary with exercise counts and completion rate
+        """
+        total_exercises = len(execution.exercise_executions)
+        exercise_by_id = {exercise.id: exercise for exercise in execution.plan.exercises}
+
+        # Calculate completion rate for each exercise based on actual vs planned
+        exercise_completion_rates = []
+        completed_count = 0
+
+        for ex_exec in execution.exercise_executions:
+            if not ex_exec.completed:
+                # Not completed at all = 0%
+                exercise_completion_rates.append(0)
+            else:
+                completed_count += 1
+                # Find the corresponding exercise from the plan
+                exercise = exercise_by_id.get(ex_exec.exercise_id)
+
+                if exercise:
+                    # Calculate based on actual vs planned
+                    if exercise.duration_minutes and ex_exec.actual_duration_minutes:
+                        # For duration-based exercises
+                        rate = min((ex_exec.actual_duration_minutes / exercise.duration_minutes) * 100, 100)
+                        exercise_completion_rates.append(rate)
+                    elif exercise.repetitions and ex_exec.actual_repetitions:
+                        # For repetition-based exercises
+                        rate = min((ex_exec.actual_repetitions / exercise.repetitions) * 100, 100)
+                        exercise_completion_rates.append(rate)
                     else:
-                        # Exercise not found in plan = 100% (assume completed)
+                        # Completed but no actual data provided = 100%
                         exercise_completion_rates.append(100)
+                else:
+                    # Exercise not found in plan = 100% (assume completed)
+                    exercise_completion_rates.append(100)
 
-            # Overall completion rate is the average of all exercise completion rates
-            completion_rate = (
-                sum(exercise_completion_rates) / len(exercise_completion_rates)
-                if exercise_completion_rates else 0
-            )
-
-            summaries.append(
-                PlanExecutionSummary(
-                    id=execution.id,
-                    plan_id=execution.plan_id,
-                    plan_name=execution.plan.name,
-                    execution_date=execution.execution_date,
-                    total_exercises=total_exercises,
-                    completed_exercises=completed_count,
-                    completion_rate=round(completion_rate, 1),
-                    created_at=execution.created_at,
-                )
-            )
+        # Overall completion rate is the average of all exercise completion rates
+        completion_rate = (
+            sum(exercise_completion_rates) / len(exercise_completion_rates)
+            if exercise_completion_rates else 0
+        )
 
-        return summaries, total_count
+        return PlanExecutionSummary.model_construct(
+            id=execution.id,
+            plan_id=execution.plan_id,
+            plan_name=execution.plan.name,
+            execution_date=execution.execution_date,
+            total_exercises=total_exercises,
+            completed_exercises=completed_count,
+            completion_rate=round(completion_rate, 1),
+            created_at=execution.created_at,
+        )
 
     async def get_plan_execution_by_id(
         self, user_id: UUID, execution_id: UUID
@@ -264,35 +312,19 @@ class PlanExecutionService:
         if execution_data.notes is not None:
             plan_execution.notes = execution_data.notes
 
-        # Update exercise executions if provided
+        # Replace exercise executions if provided
         if execution_data.exercise_executions is not None:
-            # Delete existing exercise executions
-            for existing_exec in plan_execution.exercise_executions:
-                await self.db.delete(existing_exec)
-            await self.db.flush()
-
-            # Create new exercise executions
-            for exercise_exec_data in execution_data.exercise_executions:
-                exercise_execution = ExerciseExecution(
-                    plan_execution_id=plan_execution.id,
-                    exercise_id=exercise_exec_data.exercise_id,
-                    completed=exercise_exec_data.completed,
-                    actual_duration_minutes=exercise_exec_data.actual_duration_minutes,
-                    actual_repetitions=exercise_exec_data.actual_repetitions,
-                    notes=exercise_exec_data.notes,
+            await self.db.execute(
+                delete(ExerciseExecution).where(
+                    ExerciseExecution.plan_execution_id == plan_execution.id
                 )
-                self.db.add(exercise_execution)
+            )
+            exercise_executions = await self._insert_exercise_executions(
+                plan_execution.id, execution_data.exercise_executions
+            )
+            set_committed_value(plan_execution, "exercise_executions", exercise_executions)
 
         await self.db.commit()
-        await self.db.refresh(plan_execution)
-
-        # Load relationships
-        result = await self.db.execute(
-            select(PlanExecution)
-            .where(PlanExecution.id == plan_execution.id)
-            .options(selectinload(PlanExecution.exercise_executions))
-        )
-        plan_execution = result.scalar_one()
 
         return plan_execution
 
@@ -308,7 +340,17 @@ class PlanExecutionService:
         Raises:
             NotFoundException: If plan execution not found or not owned by user
         """
-        plan_execution = await self.get_plan_execution_by_id(user_id, execution_id)
+        owned = and_(PlanExecution.id == execution_id, PlanExecution.user_id == user_id)
+
+        # Delete children with one statement instead of loading and deleting
+        # them row by row through the ORM cascade
+        await self.db.execute(
+            delete(ExerciseExecution).where(
+                ExerciseExecution.plan_execution_id.in_(select(PlanExecution.id).where(owned))
+            )
+        )
+        result = await self.db.execute(delete(PlanExecution).where(owned))
+        if result.rowcount == 0:
+            raise NotFoundException("Plan execution not found")
 
-        await self.db.delete(plan_execution)
         await self.db.commit()
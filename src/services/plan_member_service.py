@@ -1,10 +1,11 @@
 """Service for managing plan members and leaderboards."""
-from typing import List
+from typing import Dict, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, and_, or_, exists, func, desc, bindparam
 from sqlalchemy.orm import selectinload
 from src.models.plan_member import PlanMember
+from src.models.exercise import Exercise
 from src.models.fitness_plan import FitnessPlan
 from src.models.user import User
 from src.models.plan_execution import PlanExecution, ExerciseExecution
@@ -12,6 +13,29 @@ from src.api.schemas.plan_member_schemas import LeaderboardEntry
 from src.api.middleware.error_handler import NotFoundException, AppException
 
 
+# Plan with its exercises and owner, restricted to its owner and members.
+# Built once so every call reuses its cached compiled form.
+_ACCESSIBLE_PLAN_QUERY = (
+    select(FitnessPlan)
+    .where(
+        and_(
+            FitnessPlan.id == bindparam("plan_id"),
+            or_(
+                FitnessPlan.user_id == bindparam("user_id"),  # User is owner
+                exists().where(  # User is member
+                    PlanMember.plan_id == FitnessPlan.id,
+                    PlanMember.user_id == bindparam("user_id"),
+                ),
+            ),
+        )
+    )
+    .options(
+        selectinload(FitnessPlan.exercises),
+        selectinload(FitnessPlan.user)  # Load plan owner
+    )
+)
+
+
 class PlanMemberService:
     """Service for managing plan members and leaderboards."""
 
@@ -78,7 +102,6 @@ class PlanMemberService:
 
         self.db.add(member)
         await self.db.commit()
-        await self.db.refresh(member)
 
         # Reload with user relationship
         result = await self.db.execute(
@@ -106,25 +129,68 @@ class PlanMemberService:
         )
         return list(result.scalars().all())
 
-    async def get_plan_leaderboard(self, plan_id: UUID) -> List[LeaderboardEntry]:
+    @staticmethod
+    def _average_completion_rate(
+        executions: List[PlanExecution], exercise_by_id: Dict[UUID, Exercise]
+    ) -> float:
+        """Average a participant's completion rate over their plan executions.
+
+        Args:
+            executions: Participant's executions with exercise executions loaded
+            exercise_by_id: The plan's exercises keyed by ID
+
+        Returns:
+            Mean of the per-execution completion rates, 0 without any
+        """
+        # Calculate average completion rate
+        completion_rates = []
+        for execution in executions:
+            # Calculate completion rate for this execution
+            exercise_rates = []
+            for ex_exec in execution.exercise_executions:
+                if not ex_exec.completed:
+                    exercise_rates.append(0)
+                else:
+                    exercise = exercise_by_id.get(ex_exec.exercise_id)
+                    if exercise:
+                        if exercise.duration_minutes and ex_exec.actual_duration_minutes:
+                            rate = min((ex_exec.actual_duration_minutes / exercise.duration_minutes) * 100, 100)
+                            exercise_rates.append(rate)
+                        elif exercise.repetitions and ex_exec.actual_repetitions:
+                            rate = min((ex_exec.actual_repetitions / exercise.repetitions) * 100, 100)
+                            exercise_rates.append(rate)
+                        else:
+                            exercise_rates.append(100)
+                    else:
+                        exercise_rates.append(100)
+
+            if exercise_rates:
+                completion_rates.append(sum(exercise_rates) / len(exercise_rates))
+
+        return sum(completion_rates) / len(completion_rates) if completion_rates else 0
+
+    async def get_plan_leaderboard(
+        self, plan_id: UUID, user_id: UUID
+    ) -> Tuple[str, List[LeaderboardEntry]]:
         """Get leaderboard for a plan showing all members' stats.
 
         Args:
             plan_id: Plan ID
+            user_id: ID of the requesting user, who must own or be a member of the plan
 
         Returns:
-            List of leaderboard entries sorted by avg completion rate
+            Tuple of (plan name, leaderboard entries sorted by avg completion rate)
+
+        Raises:
+            NotFoundException: If plan not found or user doesn't have access
         """
-        # Get plan with owner info and exercises
+        # Get plan with owner info and exercises, checking access in the same query
         result = await self.db.execute(
-            select(FitnessPlan)
-            .where(FitnessPlan.id == plan_id)
-            .options(
-                selectinload(FitnessPlan.exercises),
-                selectinload(FitnessPlan.user)  # Load plan owner
-            )
+            _ACCESSIBLE_PLAN_QUERY, {"plan_id": plan_id, "user_id": user_id}
         )
-        plan = result.scalar_one()
+        plan = result.scalar_one_or_none()
+        if plan is None:
+            raise NotFoundException("Plan not found")
 
         # Get all invited members
         members = await self.get_plan_members(plan_id)
@@ -149,31 +215,32 @@ class PlanMemberService:
             }
 
         if not participants:
-            return []
+            return plan.name, []
 
         leaderboard = []
+        exercise_by_id = {exercise.id: exercise for exercise in plan.exercises}
 
         # Iterate through all participants (owner + members)
-        for user_id, user_info in participants.items():
-            # Get all executions for this user and plan
-            result = await self.db.execute(
+        for participant_id, user_info in participants.items():
+            # Get all executions for this participant and plan
+            executions_result = await self.db.execute(
                 select(PlanExecution)
                 .where(
                     and_(
                         PlanExecution.plan_id == plan_id,
-                        PlanExecution.user_id == user_id,
+                        PlanExecution.user_id == participant_id,
                     )
                 )
                 .options(selectinload(PlanExecution.exercise_executions))
                 .order_by(desc(PlanExecution.execution_date))
             )
-            executions = list(result.scalars().all())
+            executions = list(executions_result.scalars().all())
 
             total_executions = len(executions)
 
             if total_executions == 0:
                 # No executions yet
-                leaderboard.append(LeaderboardEntry(
+                leaderboard.append(LeaderboardEntry.model_construct(
                     user_id=user_info['user_id'],
                     user_name=user_info['user_name'],
                     user_email=user_info['user_email'],
@@ -185,34 +252,9 @@ class PlanMemberService:
                 ))
                 continue
 
-            # Calculate average completion rate
-            completion_rates = []
-            for execution in executions:
-                # Calculate completion rate for this execution
-                exercise_rates = []
-                for ex_exec in execution.exercise_executions:
-                    if not ex_exec.completed:
-                        exercise_rates.append(0)
-                    else:
-                        exercise = next((e for e in plan.exercises if e.id == ex_exec.exercise_id), None)
-                        if exercise:
-                            if exercise.duration_minutes and ex_exec.actual_duration_minutes:
-                                rate = min((ex_exec.actual_duration_minutes / exercise.duration_minutes) * 100, 100)
-                                exercise_rates.append(rate)
-                            elif exercise.repetitions and ex_exec.actual_repetitions:
-                                rate = min((ex_exec.actual_repetitions / exercise.repetitions) * 100, 100)
-                                exercise_rates.append(rate)
-                            else:
-                                exercise_rates.append(100)
-                        else:
-                            exercise_rates.append(100)
-
-                if exercise_rates:
-                    completion_rates.append(sum(exercise_rates) / len(exercise_rates))
-
-            avg_rate = sum(completion_rates) / len(completion_rates) if completion_rates else 0
+            avg_rate = self._average_completion_rate(executions, exercise_by_id)
 
-            leaderboard.append(LeaderboardEntry(
+            leaderboard.append(LeaderboardEntry.model_construct(
                 user_id=user_info['user_id'],
                 user_name=user_info['user_name'],
                 user_email=user_info['user_email'],
@@ -234,7 +276,7 @@ class PlanMemberService:
             entry.execution_count_rank = i
 
         # Return sorted by completion rate (primary) as default display order
-        return leaderboard_by_rate
+        return plan.name, leaderboard_by_rate
 
     async def remove_member(self, plan_id: UUID, user_id: UUID) -> None:
         """Remove a user from a plan.
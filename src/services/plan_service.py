@@ -1,14 +1,21 @@
 """Service layer for fitness plan business logic."""
+from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, and_, or_, insert
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from src.models.fitness_plan import FitnessPlan, PlanStatus
 from src.models.exercise import Exercise
+from src.models.plan_member import PlanMember
 from src.api.schemas.plan_schemas import FitnessPlanCreate, FitnessPlanUpdate
-from src.api.middleware.error_handler import NotFoundException, BusinessRuleViolationException
+from src.api.middleware.error_handler import (
+    AppException,
+    NotFoundException,
+    BusinessRuleViolationException,
+)
+from src.core.pagination import apply_keyset_page, split_keyset_page
 
 
 class PlanService:
@@ -36,20 +43,24 @@ class PlanService:
         # Flush to get plan ID
         await self.db.flush()
 
-        # Add exercises
-        for exercise_data in plan_data.exercises:
-            exercise = Exercise(
-                plan_id=plan.id,
-                name=exercise_data.name,
-                duration_minutes=exercise_data.duration_minutes,
-                repetitions=exercise_data.repetitions,
-                intensity=exercise_data.intensity,
-                order_index=exercise_data.order_index,
-            )
-            self.db.add(exercise)
+        # Add exercises in a single batched INSERT
+        await self.db.execute(
+            insert(Exercise),
+            [
+                {
+                    "plan_id": plan.id,
+                    "name": exercise_data.name,
+                    "duration_minutes": exercise_data.duration_minutes,
+                    "repetitions": exercise_data.repetitions,
+                    "intensity": exercise_data.intensity,
+                    "order_index": exercise_data.order_index,
+                }
+                for exercise_data in plan_data.exercises
+            ],
+        )
 
         await self.db.commit()
-        await self.db.refresh(plan)
+        await self.db.refresh(plan, ["exercises", "reminders"])
 
         return plan
 
@@ -59,60 +70,85 @@ class PlanService:
         status: Optional[PlanStatus] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> Tuple[List[FitnessPlan], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[List[Tuple[FitnessPlan, int]], Optional[int], Optional[str]]:
         """Get paginated list of user's fitness plans (created by user or joined as member).
 
         Args:
             user_id: ID of the user
             status: Optional filter by plan status
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when cursor is given
             page_size: Number of items per page
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to run the COUNT query for the total
 
         Returns:
-            Tuple of (list of plans, total count)
+            Tuple of (list of (plan, exercise count) pairs, total count or None,
+            next page cursor or None). Plans carry their owner but not their
+            exercises or reminders.
+
+        Raises:
+            AppException: If the cursor is malformed
         """
-        from src.models.plan_member import PlanMember
-        from src.models.user import User
-        from sqlalchemy import or_
-
-        # Build base query - include plans created by user OR where user is a member
-        query = select(FitnessPlan).where(
-            and_(
-                or_(
-                    FitnessPlan.user_id == user_id,  # Plans created by user
-                    FitnessPlan.id.in_(  # Plans where user is a member
-                        select(PlanMember.plan_id).where(PlanMember.user_id == user_id)
-                    )
+        # Include plans created by user OR where user is a member
+        filters = [
+            or_(
+                FitnessPlan.user_id == user_id,  # Plans created by user
+                FitnessPlan.id.in_(  # Plans where user is a member
+                    select(PlanMember.plan_id).where(PlanMember.user_id == user_id)
                 ),
-                FitnessPlan.deleted_at.is_(None)
-            )
-        )
+            ),
+            FitnessPlan.deleted_at.is_(None),
+        ]
 
         # Filter by status if provided
         if status:
-            query = query.where(FitnessPlan.status == status)
+            filters.append(FitnessPlan.status == status)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_count_result = await self.db.execute(count_query)
-        total_count = total_count_result.scalar()
+        query = select(FitnessPlan).where(*filters)
 
-        # Apply pagination and eager load user (owner) relationship
-        offset = (page - 1) * page_size
-        query = (
-            query.options(
-                selectinload(FitnessPlan.exercises),
-                selectinload(FitnessPlan.user)
+        # Get total count straight from the table rather than wrapping the query
+        total_count = None
+        if include_total:
+            total_count_result = await self.db.execute(
+                select(func.count()).select_from(FitnessPlan).where(*filters)
             )
-            .order_by(FitnessPlan.updated_at.desc())
-            .offset(offset)
-            .limit(page_size)
+            total_count = total_count_result.scalar()
+
+        # Summaries only need the owner and the number of exercises, so count
+        # exercises in SQL and skip loading the exercise and reminder rows
+        exercise_count = (
+            select(func.count(Exercise.id))
+            .where(Exercise.plan_id == FitnessPlan.id)
+            .correlate(FitnessPlan)
+            .scalar_subquery()
         )
 
+        # Apply pagination (most recently updated first) and eager load user (owner) relationship
+        sort_key = (FitnessPlan.updated_at, FitnessPlan.id)
+        try:
+            query = apply_keyset_page(
+                query.add_columns(exercise_count.label("exercise_count")).options(
+                    joinedload(FitnessPlan.user),
+                    raiseload(FitnessPlan.exercises),
+                    raiseload(FitnessPlan.reminders),
+                ),
+                sort_key,
+                (datetime.fromisoformat, UUID),
+                page,
+                page_size,
+                cursor,
+            )
+        except ValueError:
+            raise AppException("Invalid pagination cursor", "INVALID_CURSOR")
+
         result = await self.db.execute(query)
-        plans = result.scalars().all()
+        rows, next_cursor = split_keyset_page(
+            [tuple(row) for row in result.all()], sort_key, page_size
+        )
 
-        return plans, total_count
+        return rows, total_count, next_cursor
 
     async def get_plan_by_id(self, user_id: UUID, plan_id: UUID) -> FitnessPlan:
         """Get a specific fitness plan by ID.
@@ -127,9 +163,6 @@ class PlanService:
         Raises:
             NotFoundException: If plan not found or user doesn't have access
         """
-        from src.models.plan_member import PlanMember
-        from sqlalchemy import or_
-
         query = (
             select(FitnessPlan)
             .where(
@@ -195,7 +228,6 @@ class PlanService:
         Raises:
             NotFoundException: If plan not found or user doesn't own it
         """
-        from datetime import datetime
 
         # Get existing plan with reminders
         plan = await self.get_plan_by_id(user_id, plan_id)
@@ -4,6 +4,7 @@ from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
+from sqlalchemy.orm import selectinload
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from src.models.reminder import Reminder, ReminderFrequency
@@ -74,7 +75,6 @@ class ReminderService:
             await self._schedule_job(reminder, plan)
 
         await self.db.commit()
-        await self.db.refresh(reminder)
 
         return reminder
 
@@ -246,7 +246,7 @@ class ReminderService:
         )
 
     def _create_cron_trigger(
-        self, reminder_time: time, frequency: ReminderFrequency, days_of_week: Optional[List[int]]
+        self, reminder_time: time, frequency: str, days_of_week: Optional[List[int]]
     ) -> CronTrigger:
         """Create a CronTrigger from reminder settings.
 
@@ -322,6 +322,7 @@ async def send_reminder_notification(plan_id_str: str, reminder_id_str: str) ->
                     FitnessPlan.deleted_at.is_(None),
                 )
             )
+            .options(selectinload(FitnessPlan.exercises))
         )
         plan = result.scalar_one_or_none()
 
@@ -1,16 +1,18 @@
 """Service for managing workout logs."""
 from typing import Tuple, Optional
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, desc
+from sqlalchemy import select, and_, func, text
 from src.models.workout_log import WorkoutLog
 from src.api.schemas.workout_log_schemas import (
     WorkoutLogCreate,
     WorkoutLogUpdate,
     WorkoutStats,
+    ChartDataPoint,
 )
-from src.api.middleware.error_handler import NotFoundException
+from src.api.middleware.error_handler import AppException, NotFoundException
+from src.core.pagination import apply_keyset_page, split_keyset_page
 
 
 class WorkoutLogService:
@@ -47,7 +49,6 @@ class WorkoutLogService:
 
         self.db.add(workout_log)
         await self.db.commit()
-        await self.db.refresh(workout_log)
 
         return workout_log
 
@@ -58,43 +59,65 @@ class WorkoutLogService:
         end_date: Optional[date] = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> Tuple[list[WorkoutLog], int]:
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+    ) -> Tuple[list[WorkoutLog], Optional[int], Optional[str]]:
         """Get paginated workout logs for a user.
 
+        Pages are addressed either by ``page`` (OFFSET) or, when ``cursor`` is
+        given, by seeking past the last row of the previous page.
+
         Args:
             user_id: User ID
             start_date: Optional start date filter
             end_date: Optional end date filter
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when cursor is given
             page_size: Items per page
+            cursor: Opaque cursor from a previous page's next_cursor
+            include_total: Whether to run the COUNT query for the total
 
         Returns:
-            Tuple of (workout logs list, total count)
-        """
-        # Build query with filters
-        query = select(WorkoutLog).where(WorkoutLog.user_id == user_id)
+            Tuple of (workout logs list, total count or None, next page
+            cursor or None)
 
+        Raises:
+            AppException: If the cursor is malformed
+        """
+        filters = [WorkoutLog.user_id == user_id]
         if start_date:
-            query = query.where(WorkoutLog.workout_date >= start_date)
+            filters.append(WorkoutLog.workout_date >= start_date)
         if end_date:
-            query = query.where(WorkoutLog.workout_date <= end_date)
-
-        # Order by date descending (most recent first)
-        query = query.order_by(desc(WorkoutLog.workout_date), desc(WorkoutLog.created_at))
+            filters.append(WorkoutLog.workout_date <= end_date)
 
         # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total_count = count_result.scalar() or 0
-
-        # Apply pagination
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        total_count = None
+        if include_total:
+            count_result = await self.db.execute(
+                select(func.count()).select_from(WorkoutLog).where(*filters)
+            )
+            total_count = count_result.scalar() or 0
+
+        # Order by date descending (most recent first), then apply pagination
+        sort_key = (WorkoutLog.workout_date, WorkoutLog.created_at, WorkoutLog.id)
+        try:
+            query = apply_keyset_page(
+                select(WorkoutLog).where(*filters),
+                sort_key,
+                (date.fromisoformat, datetime.fromisoformat, UUID),
+                page,
+                page_size,
+                cursor,
+            )
+        except ValueError:
+            raise AppException("Invalid pagination cursor", "INVALID_CURSOR")
 
         # Execute query
         result = await self.db.execute(query)
-        workout_logs = list(result.scalars().all())
+        workout_logs, next_cursor = split_keyset_page(
+            list(result.scalars().all()), sort_key, page_size
+        )
 
-        return workout_logs, total_count
+        return workout_logs, total_count, next_cursor
 
     async def get_workout_log_by_id(
         self, user_id: UUID, workout_log_id: UUID
@@ -212,9 +235,29 @@ class WorkoutLogService:
             avg_calories=float(row.avg_calories or 0),
         )
 
+    async def get_chart_version(self, user_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Get a cheap fingerprint of a user's workout logs for chart caching.
+
+        Adding or editing a log moves the latest updated_at, and deleting one
+        lowers the count, so any change to the chart data changes the result.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Tuple of (log count, latest updated_at or None)
+        """
+        result = await self.db.execute(
+            select(func.count(WorkoutLog.id), func.max(WorkoutLog.updated_at)).where(
+                WorkoutLog.user_id == user_id
+            )
+        )
+        count, last_updated = result.one()
+        return count, last_updated
+
     async def get_chart_data(
         self, user_id: UUID, period_type: str = "week", limit: int = 12
-    ) -> list[dict]:
+    ) -> list[ChartDataPoint]:
         """Get aggregated workout data for charts.
 
         Args:
@@ -225,8 +268,6 @@ class WorkoutLogService:
         Returns:
             List of aggregated data points
         """
-        from sqlalchemy import text
-
         if period_type == "week":
             # SQLite uses strftime for date formatting
             # %Y-W%W gives year and week number
@@ -282,12 +323,12 @@ class WorkoutLogService:
                 }
                 label = f"{year}年{month_names[month]}"
 
-            data_points.append({
-                "period": period,
-                "label": label,
-                "workouts": int(row[1] or 0),
-                "duration_minutes": int(row[2] or 0),
-                "calories": float(row[3] or 0),
-            })
+            data_points.append(ChartDataPoint.model_construct(
+                period=period,
+                label=label,
+                workouts=int(row[1] or 0),
+                duration_minutes=int(row[2] or 0),
+                calories=float(row[3] or 0),
+            ))
 
         return data_points
@@ -31,7 +31,7 @@ class API {
             // 处理401未授权
             if (response.status === 401) {
                 localStorage.removeItem('access_token');
-                window.location.href = '/login.html';
+                window.location.href = '/static/login.html';
                 return;
             }
 
@@ -82,7 +82,7 @@ class API {
     // ========== 健身计划相关 ==========
 
     static async getPlans(page = 1, pageSize = 20, status = null) {
-        let url = `/api/v1/plans/?page=${page}&page_size=${pageSize}`;
+        let url = `/api/v1/plans/?page=${page}&page_size=${pageSize}&include_total=true`;
         if (status) {
             url += `&status=${status}`;
         }
@@ -240,7 +240,7 @@ class API {
     // ========== 健身房器械训练相关 ==========
 
     static async getGymExercises(page = 1, pageSize = 20, startDate = null, endDate = null) {
-        let url = `/api/v1/gym-exercises/?page=${page}&page_size=${pageSize}`;
+        let url = `/api/v1/gym-exercises/?page=${page}&page_size=${pageSize}&include_total=true`;
         if (startDate) {
             url += `&start_date=${startDate}`;
         }
@@ -360,12 +360,12 @@ class Auth {
 
     static logout() {
         localStorage.removeItem('access_token');
-        window.location.href = '/login.html';
+        window.location.href = '/static/login.html';
     }
 
     static requireAuth() {
         if (!this.isLoggedIn()) {
-            window.location.href = '/login.html';
+            window.location.href = '/static/login.html';
             return false;
         }
         return true;
@@ -38,7 +38,7 @@ class TestExerciseServiceAdd:
         assert exercise.id is not None
         assert exercise.name == "Push-ups"
         assert exercise.repetitions == 20
-        assert exercise.intensity.value == "high"
+        assert exercise.intensity == "high"
         assert exercise.plan_id == plan.id
 
     @pytest.mark.asyncio
@@ -89,7 +89,7 @@ class TestExerciseServiceUpdate:
 
         assert updated_exercise.name == "Fast Running"
         assert updated_exercise.duration_minutes == 45
-        assert updated_exercise.intensity.value == "high"
+        assert updated_exercise.intensity == "high"
 
     @pytest.mark.asyncio
     async def test_update_exercise_partial(self, db_session):
@@ -119,7 +119,7 @@ class TestExerciseServiceUpdate:
         # Only intensity should change
         assert updated_exercise.name == "Running"
         assert updated_exercise.duration_minutes == 30
-        assert updated_exercise.intensity.value == "high"
+        assert updated_exercise.intensity == "high"
 
     @pytest.mark.asyncio
     async def test_update_exercise_not_found(self, db_session):
@@ -0,0 +1,214 @@
+"""Unit tests for GymExerciseService."""
+import pytest
+from datetime import date
+from uuid import uuid4
+from sqlalchemy import select, func
+from src.models.gym_exercise import GymExerciseSet
+from src.services.gym_exercise_service import GymExerciseService
+from src.api.schemas.gym_exercise_schemas import (
+    GymExerciseLogCreate,
+    GymExerciseLogUpdate,
+    GymExerciseSetCreate,
+)
+from src.api.middleware.error_handler import AppException, NotFoundException
+
+
+async def _create_logs(service: GymExerciseService, user_id, days: int) -> None:
+    for day in range(1, days + 1):
+        await service.create_gym_exercise_log(
+            user_id,
+            GymExerciseLogCreate(
+                workout_date=date(2025, 1, day),
+                exercise_name="Bench Press",
+                sets=[GymExerciseSetCreate(set_number=1, reps=5, weight=60)],
+            ),
+        )
+
+
+@pytest.mark.unit
+class TestGymExerciseServicePagination:
+    """Unit tests for listing gym exercise logs."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(self, db_session):
+        """Test that walking next_cursor visits the same rows as page numbers."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 5)
+
+        by_page = []
+        for page in (1, 2, 3):
+            logs, total, _ = await service.get_gym_exercise_logs(user_id, page=page, page_size=2)
+            by_page.extend(log.id for log in logs)
+        assert total == 5
+
+        by_cursor = []
+        cursor = None
+        while True:
+            logs, total, cursor = await service.get_gym_exercise_logs(
+                user_id, page_size=2, cursor=cursor, include_total=False
+            )
+            assert total is None
+            by_cursor.extend(log.id for log in logs)
+            if cursor is None:
+                break
+
+        assert by_cursor == by_page
+        assert len(by_cursor) == 5
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, db_session):
+        """Test that next_cursor is None once all rows are returned."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 2)
+
+        logs, _, cursor = await service.get_gym_exercise_logs(user_id, page_size=2)
+
+        assert len(logs) == 2
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_summary_totals(self, db_session):
+        """Test that set totals are aggregated per log."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        await service.create_gym_exercise_log(
+            user_id,
+            GymExerciseLogCreate(
+                workout_date=date(2025, 1, 1),
+                exercise_name="Pull-up",
+                sets=[
+                    GymExerciseSetCreate(set_number=1, reps=8, weight=10),
+                    GymExerciseSetCreate(set_number=2, reps=6),
+                ],
+            ),
+        )
+        await _create_logs(service, user_id, 1)
+
+        logs, _, _ = await service.get_gym_exercise_logs(user_id)
+
+        totals = {log.exercise_name: (log.total_sets, log.total_reps, log.total_volume) for log in logs}
+        assert totals == {"Pull-up": (2, 14, 80), "Bench Press": (1, 5, 300)}
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, db_session):
+        """Test that a malformed cursor raises AppException."""
+        service = GymExerciseService(db_session)
+
+        with pytest.raises(AppException):
+            await service.get_gym_exercise_logs(uuid4(), cursor="not-a-cursor")
+
+
+@pytest.mark.unit
+class TestGymExerciseServiceExerciseNames:
+    """Unit tests for listing exercise names."""
+
+    @pytest.mark.asyncio
+    async def test_names_are_distinct_sorted_and_per_user(self, db_session):
+        """Test that each of the user's exercise names is returned once, alphabetically."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        assert await service.get_exercise_names(user_id) == []
+
+        for name in ("Squat", "Bench Press", "Squat", "Deadlift"):
+            await service.create_gym_exercise_log(
+                user_id,
+                GymExerciseLogCreate(
+                    workout_date=date(2025, 1, 1),
+                    exercise_name=name,
+                    sets=[GymExerciseSetCreate(set_number=1, reps=5)],
+                ),
+            )
+        await _create_logs(service, uuid4(), 1)
+
+        assert await service.get_exercise_names(user_id) == ["Bench Press", "Deadlift", "Squat"]
+
+
+@pytest.mark.unit
+class TestGymExerciseServiceUpdate:
+    """Unit tests for updating gym exercise logs."""
+
+    @pytest.mark.asyncio
+    async def test_update_replaces_sets(self, db_session):
+        """Test that new sets replace the old ones and come back ordered by set number."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 1)
+        logs, _, _ = await service.get_gym_exercise_logs(user_id)
+
+        updated = await service.update_gym_exercise_log(
+            user_id,
+            logs[0].id,
+            GymExerciseLogUpdate(
+                exercise_name="Squat",
+                sets=[
+                    GymExerciseSetCreate(set_number=2, reps=3, weight=100),
+                    GymExerciseSetCreate(set_number=1, reps=5, weight=90),
+                ],
+            ),
+        )
+
+        assert updated.exercise_name == "Squat"
+        assert [(s.set_number, s.reps) for s in updated.sets] == [(1, 5), (2, 3)]
+        reloaded = await service.get_gym_exercise_log_by_id(user_id, logs[0].id)
+        assert [s.id for s in reloaded.sets] == [s.id for s in updated.sets]
+
+
+@pytest.mark.unit
+class TestGymExerciseServiceDelete:
+    """Unit tests for deleting gym exercise logs."""
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_log_and_sets(self, db_session):
+        """Test that deleting a log also deletes its sets."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 1)
+        logs, _, _ = await service.get_gym_exercise_logs(user_id)
+
+        await service.delete_gym_exercise_log(user_id, logs[0].id)
+
+        remaining = await db_session.execute(
+            select(func.count()).select_from(GymExerciseSet).where(
+                GymExerciseSet.gym_exercise_log_id == logs[0].id
+            )
+        )
+        assert remaining.scalar() == 0
+        with pytest.raises(NotFoundException):
+            await service.get_gym_exercise_log_by_id(user_id, logs[0].id)
+
+    @pytest.mark.asyncio
+    async def test_delete_other_users_log(self, db_session):
+        """Test that a user cannot delete another user's log."""
+        service = GymExerciseService(db_session)
+        owner_id = uuid4()
+        await _create_logs(service, owner_id, 1)
+        logs, _, _ = await service.get_gym_exercise_logs(owner_id)
+
+        with pytest.raises(NotFoundException):
+            await service.delete_gym_exercise_log(uuid4(), logs[0].id)
+
+        log = await service.get_gym_exercise_log_by_id(owner_id, logs[0].id)
+        assert len(log.sets) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_skips_other_users_logs(self, db_session):
+        """Test that bulk delete only removes the caller's logs."""
+        service = GymExerciseService(db_session)
+        user_id = uuid4()
+        other_id = uuid4()
+        await _create_logs(service, user_id, 2)
+        await _create_logs(service, other_id, 1)
+        mine, _, _ = await service.get_gym_exercise_logs(user_id)
+        theirs, _, _ = await service.get_gym_exercise_logs(other_id)
+
+        deleted = await service.delete_gym_exercise_logs(
+            user_id, [log.id for log in mine] + [theirs[0].id]
+        )
+
+        assert deleted == 2
+        _, remaining, _ = await service.get_gym_exercise_logs(user_id)
+        assert remaining == 0
+        _, remaining, _ = await service.get_gym_exercise_logs(other_id)
+        assert remaining == 1
@@ -1,5 +1,6 @@
 """Unit tests for NotificationService."""
 import pytest
+from datetime import datetime
 from uuid import uuid4
 from unittest.mock import MagicMock
 from src.services.notification_service import NotificationService
@@ -164,6 +165,7 @@ class TestNotificationServiceSending:
         assert result["plan_id"] == str(plan_id)
         assert "message" in result
         assert "晨跑计划" in result["message"]
+        assert datetime.strptime(result["timestamp"], "%Y-%m-%dT%H:%M:%SZ")
 
     @pytest.mark.asyncio
     async def test_send_bulk_notifications(self):
@@ -206,3 +208,32 @@ class TestNotificationServiceSending:
         assert result["successful"] == 3
         assert result["failed"] == 0
         assert len(result["results"]) == 3
+        assert len({r["timestamp"] for r in result["results"]}) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_bulk_notifications_counts_failures(self):
+        """Test that one failed send is counted without aborting the others."""
+        service = NotificationService()
+        failing_user = uuid4()
+        original_send = service.send_push_notification
+
+        async def send(**kwargs):
+            if kwargs["user_id"] == failing_user:
+                raise RuntimeError("push gateway unavailable")
+            return await original_send(**kwargs)
+
+        service.send_push_notification = send
+        notifications = [
+            {"user_id": user_id, "plan_id": uuid4(), "plan_name": "计划", "exercises": []}
+            for user_id in (uuid4(), failing_user, uuid4())
+        ]
+
+        result = await service.send_bulk_notifications(notifications)
+
+        assert result["total"] == 3
+        assert result["successful"] == 2
+        assert result["failed"] == 1
+        assert [r["user_id"] for r in result["results"]] == [
+            str(notifications[0]["user_id"]),
+            str(notifications[2]["user_id"]),
+        ]
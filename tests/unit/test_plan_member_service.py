@@ -0,0 +1,59 @@
+"""Unit tests for PlanMemberService."""
+import pytest
+from uuid import uuid4
+from src.models.plan_member import PlanMember
+from src.models.user import User
+from src.services.plan_member_service import PlanMemberService
+from src.services.plan_service import PlanService
+from src.api.schemas.plan_schemas import FitnessPlanCreate, ExerciseCreate
+from src.api.middleware.error_handler import NotFoundException
+
+
+async def _create_plan(db_session, owner_email: str = "owner@example.com"):
+    owner = User(email=owner_email, password_hash="x")
+    db_session.add(owner)
+    await db_session.commit()
+    return await PlanService(db_session).create_plan(
+        owner.id,
+        FitnessPlanCreate(name="Plan", exercises=[ExerciseCreate(name="Running", duration_minutes=30)]),
+    )
+
+
+@pytest.mark.unit
+class TestPlanMemberServiceLeaderboard:
+    """Unit tests for the plan leaderboard access check."""
+
+    @pytest.mark.asyncio
+    async def test_owner_gets_leaderboard(self, db_session):
+        """Test that the owner gets the plan name and their own entry."""
+        plan = await _create_plan(db_session, "lb-owner@example.com")
+        service = PlanMemberService(db_session)
+
+        plan_name, leaderboard = await service.get_plan_leaderboard(plan.id, plan.user_id)
+
+        assert plan_name == "Plan"
+        assert [entry.user_id for entry in leaderboard] == [plan.user_id]
+
+    @pytest.mark.asyncio
+    async def test_member_gets_leaderboard(self, db_session):
+        """Test that members can view the leaderboard."""
+        plan = await _create_plan(db_session, "lb-host@example.com")
+        member = User(email="lb-member@example.com", password_hash="x")
+        db_session.add(member)
+        await db_session.commit()
+        db_session.add(PlanMember(plan_id=plan.id, user_id=member.id, invited_by=plan.user_id))
+        await db_session.commit()
+        service = PlanMemberService(db_session)
+
+        _, leaderboard = await service.get_plan_leaderboard(plan.id, member.id)
+
+        assert {entry.user_id for entry in leaderboard} == {plan.user_id, member.id}
+
+    @pytest.mark.asyncio
+    async def test_outsider_denied(self, db_session):
+        """Test that users who are neither owner nor member get NotFoundException."""
+        plan = await _create_plan(db_session, "lb-private@example.com")
+        service = PlanMemberService(db_session)
+
+        with pytest.raises(NotFoundException):
+            await service.get_plan_leaderboard(plan.id, uuid4())
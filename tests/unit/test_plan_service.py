@@ -120,16 +120,80 @@ class TestPlanServiceList:
             await service.create_plan(user_id, plan_data)
 
         # Get first page (2 items)
-        plans, total = await service.get_user_plans(user_id, page=1, page_size=2)
+        plans, total, _ = await service.get_user_plans(user_id, page=1, page_size=2)
 
         assert len(plans) == 2
         assert total == 3
+        assert all(exercise_count == 1 for _, exercise_count in plans)
 
         # Get second page (1 item)
-        plans_page2, _ = await service.get_user_plans(user_id, page=2, page_size=2)
+        plans_page2, _, _ = await service.get_user_plans(user_id, page=2, page_size=2)
 
         assert len(plans_page2) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_user_plans_exercise_count(self, db_session):
+        """Test that listed plans carry their exercise count."""
+        service = PlanService(db_session)
+        user_id = uuid4()
+
+        for count in (1, 3):
+            plan_data = FitnessPlanCreate(
+                name=f"Plan {count}",
+                exercises=[ExerciseCreate(name=f"Ex {i}", repetitions=10) for i in range(count)],
+            )
+            await service.create_plan(user_id, plan_data)
+
+        plans, _, _ = await service.get_user_plans(user_id)
+
+        assert {plan.name: exercise_count for plan, exercise_count in plans} == {
+            "Plan 1": 1,
+            "Plan 3": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_user_plans_cursor(self, db_session):
+        """Test walking user plans with next_cursor."""
+        service = PlanService(db_session)
+        user_id = uuid4()
+
+        for i in range(3):
+            plan_data = FitnessPlanCreate(
+                name=f"Plan {i}",
+                exercises=[ExerciseCreate(name="Running", duration_minutes=30)],
+            )
+            await service.create_plan(user_id, plan_data)
+
+        plans, total, cursor = await service.get_user_plans(
+            user_id, page_size=2, include_total=False
+        )
+        assert len(plans) == 2
+        assert total is None
+        assert cursor is not None
+
+        plans_page2, _, cursor = await service.get_user_plans(
+            user_id, page_size=2, cursor=cursor
+        )
+        assert len(plans_page2) == 1
+        assert cursor is None
+        assert {p.id for p, _ in plans}.isdisjoint(p.id for p, _ in plans_page2)
+
+    @pytest.mark.asyncio
+    async def test_get_user_plans_status_filter(self, db_session):
+        """Test filtering user plans by status."""
+        service = PlanService(db_session)
+        user_id = uuid4()
+        plan_data = FitnessPlanCreate(
+            name="Plan", exercises=[ExerciseCreate(name="Running", duration_minutes=30)]
+        )
+        await service.create_plan(user_id, plan_data)
+
+        active, _, _ = await service.get_user_plans(user_id, status=PlanStatus.ACTIVE)
+        paused, _, _ = await service.get_user_plans(user_id, status=PlanStatus.PAUSED)
+
+        assert [plan.status for plan, _ in active] == ["active"]
+        assert paused == []
+
 
 @pytest.mark.unit
 class TestPlanServiceUpdate:
@@ -0,0 +1,135 @@
+"""Unit tests for JWT security helpers."""
+import base64
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from jose import jwt
+
+from src.core import security
+from src.core.config import settings
+from src.core.security import create_access_token, hash_password, verify_password, verify_token
+
+
+@pytest.mark.unit
+class TestVerifyTokenCache:
+    """Unit tests for the verified-token cache."""
+
+    def setup_method(self):
+        security._token_cache.clear()
+
+    def test_repeat_token_skips_decode(self):
+        """Test that a cached token is not decoded again."""
+        token = create_access_token({"user_id": "abc"})
+        assert verify_token(token)["user_id"] == "abc"
+
+        with patch.object(security, "_decode_hs256") as decode:
+            assert verify_token(token)["user_id"] == "abc"
+            decode.assert_not_called()
+
+    def test_expired_cached_token_rejected(self):
+        """Test that a cached token stops validating once it expires."""
+        token = create_access_token({"user_id": "abc"}, expires_delta=timedelta(seconds=-1))
+        security._token_cache[token] = {"user_id": "abc", "exp": time.time() - 1}
+
+        assert verify_token(token) is None
+        assert token not in security._token_cache
+
+    def test_invalid_token_not_cached(self):
+        """Test that invalid tokens return None and are not cached."""
+        assert verify_token("not-a-jwt") is None
+        assert len(security._token_cache) == 0
+
+    def test_cache_is_bounded(self):
+        """Test that the cache evicts least recently used tokens."""
+        with patch.object(security, "TOKEN_CACHE_SIZE", 2):
+            tokens = [create_access_token({"user_id": str(i)}) for i in range(3)]
+            for token in tokens:
+                verify_token(token)
+
+        assert list(security._token_cache) == tokens[1:]
+
+
+@pytest.mark.unit
+class TestVerifyTokenHS256:
+    """Unit tests for the HS256 verification fast path."""
+
+    def setup_method(self):
+        security._token_cache.clear()
+
+    def test_valid_token(self):
+        """Test that tokens issued by create_access_token verify."""
+        token = create_access_token({"user_id": "abc", "email": "a@example.com"})
+
+        payload = verify_token(token)
+
+        assert payload["user_id"] == "abc"
+        assert payload["email"] == "a@example.com"
+
+    def test_issued_token_decodes_with_jose(self):
+        """Test that tokens signed by the fast path are standard HS256 JWTs."""
+        token = create_access_token({"user_id": "abc"}, expires_delta=timedelta(minutes=5))
+
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+
+        assert payload["user_id"] == "abc"
+        assert payload["exp"] > time.time()
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+    def test_tampered_payload_rejected(self):
+        """Test that a token whose payload was altered is rejected."""
+        header, _, signature = create_access_token({"user_id": "abc"}).split(".")
+        forged = create_access_token({"user_id": "xyz"}).split(".")[1]
+
+        assert verify_token(f"{header}.{forged}.{signature}") is None
+
+    def test_wrong_key_rejected(self):
+        """Test that a token signed with another secret is rejected."""
+        token = jwt.encode({"user_id": "abc"}, "other-secret", algorithm="HS256")
+
+        assert verify_token(token) is None
+
+    def test_alg_none_rejected(self):
+        """Test that unsigned tokens are rejected."""
+        header = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b"=").decode()
+        payload = base64.urlsafe_b64encode(b'{"user_id":"abc"}').rstrip(b"=").decode()
+
+        assert verify_token(f"{header}.{payload}.") is None
+
+    def test_expired_token_rejected(self):
+        """Test that expired tokens are rejected."""
+        token = create_access_token({"user_id": "abc"}, expires_delta=timedelta(seconds=-5))
+
+        assert verify_token(token) is None
+
+    def test_other_registered_claims_use_jose(self):
+        """Test that tokens with claims like nbf are validated by jose."""
+        token = jwt.encode(
+            {"user_id": "abc", "nbf": int(time.time()) + 3600},
+            settings.jwt_secret_key,
+            algorithm="HS256",
+        )
+
+        assert verify_token(token) is None
+
+
+@pytest.mark.unit
+class TestPasswordHashing:
+    """Unit tests for bcrypt password hashing."""
+
+    def test_hash_and_verify(self):
+        """Test that a hashed password verifies and a wrong one does not."""
+        with patch.object(settings, "bcrypt_rounds", 4):
+            hashed = hash_password("correct horse")
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+
+    def test_long_password_truncated(self):
+        """Test that passwords over bcrypt's 72-byte limit hash on their prefix."""
+        with patch.object(settings, "bcrypt_rounds", 4):
+            hashed = hash_password("é" * 40)
+
+        assert verify_password("é" * 36 + "x", hashed)
@@ -0,0 +1,34 @@
+"""Unit tests for custom model types."""
+import time
+import uuid
+import pytest
+from src.models.types import uuid7
+
+
+@pytest.mark.unit
+class TestUUID7:
+    """Unit tests for time-ordered primary key generation."""
+
+    def test_version_and_variant(self):
+        """Test that generated ids are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_embeds_current_time(self):
+        """Test that the leading 48 bits hold the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        """Test that ids from later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+        assert str(first) < str(second)
@@ -0,0 +1,93 @@
+"""Unit tests for WorkoutLogService."""
+import pytest
+from datetime import date
+from uuid import uuid4
+from src.services.workout_log_service import WorkoutLogService
+from src.api.schemas.workout_log_schemas import WorkoutLogCreate
+
+
+async def _create_logs(service: WorkoutLogService, user_id, days: int) -> None:
+    for day in range(1, days + 1):
+        await service.create_workout_log(
+            user_id,
+            WorkoutLogCreate(
+                workout_date=date(2025, 1, day),
+                workout_name="Running",
+                duration_minutes=30,
+            ),
+        )
+
+
+@pytest.mark.unit
+class TestWorkoutLogServicePagination:
+    """Unit tests for listing workout logs."""
+
+    @pytest.mark.asyncio
+    async def test_total_matches_stats(self, db_session):
+        """Test that the COUNT total equals total_workouts under the same filters."""
+        service = WorkoutLogService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 5)
+
+        logs, total, _ = await service.get_workout_logs(
+            user_id, start_date=date(2025, 1, 2), page_size=2
+        )
+        stats = await service.get_workout_stats(user_id, start_date=date(2025, 1, 2))
+
+        assert [log.workout_date.day for log in logs] == [5, 4]
+        assert total == stats.total_workouts == 4
+
+    @pytest.mark.asyncio
+    async def test_skip_total(self, db_session):
+        """Test that include_total=False skips the count."""
+        service = WorkoutLogService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 3)
+
+        logs, total, _ = await service.get_workout_logs(user_id, page=2, page_size=2, include_total=False)
+
+        assert total is None
+        assert len(logs) == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(self, db_session):
+        """Test that walking next_cursor visits the same rows as page numbers."""
+        service = WorkoutLogService(db_session)
+        user_id = uuid4()
+        await _create_logs(service, user_id, 5)
+
+        by_page = []
+        for page in (1, 2, 3):
+            logs, _, _ = await service.get_workout_logs(user_id, page=page, page_size=2)
+            by_page.extend(log.id for log in logs)
+
+        by_cursor = []
+        cursor = None
+        while True:
+            logs, _, cursor = await service.get_workout_logs(user_id, page_size=2, cursor=cursor)
+            by_cursor.extend(log.id for log in logs)
+            if cursor is None:
+                break
+
+        assert by_cursor == by_page
+        assert len(by_cursor) == 5
+
+
+@pytest.mark.unit
+class TestWorkoutLogServiceChartVersion:
+    """Unit tests for the chart data fingerprint."""
+
+    @pytest.mark.asyncio
+    async def test_version_changes_on_add_and_delete(self, db_session):
+        """Test that adding or deleting a log changes the fingerprint."""
+        service = WorkoutLogService(db_session)
+        user_id = uuid4()
+        assert await service.get_chart_version(user_id) == (0, None)
+
+        await _create_logs(service, user_id, 2)
+        after_add = await service.get_chart_version(user_id)
+        assert after_add[0] == 2
+
+        logs, _, _ = await service.get_workout_logs(user_id)
+        await service.delete_workout_log(user_id, logs[0].id)
+        assert await service.get_chart_version(user_id) != after_add